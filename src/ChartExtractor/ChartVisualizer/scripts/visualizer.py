@@ -1,4 +1,11 @@
-from PIL import Image, ImageDraw
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+import os
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+from PIL import Image
 
 """
 
@@ -6,8 +13,8 @@ This script creates visualizations of intraoperative charts from pixel coordinat
 The final version will take a JSON file of detections as input and output a PNG with the corresponding
 blood pressure and heart rate data. This version uses hard-coded numbers to show proof of concept.
 
-Each detection will be converted to a tuple of (x, y) coordinates in pixels and added to
-a list of coordinates.
+Each detection will be converted to an (x, y) pixel coordinate, and the detections for each
+sprite are held together as an (N, 2) int32 array so placement can be vectorized.
 
 Asset Pixel Data:
 
@@ -18,28 +25,106 @@ dot is 10x10
 """
 
 
+# Register the core format plugins (PNG included) at import rather than on first save.
+Image.preinit()
+
 # Open required asset files as Image objects
-chart = Image.open("../assets/blank_sheet.png")
+BLANK_SHEET_PATH = "../assets/blank_sheet.png"
 sys_arrow = Image.open("../assets/systolic_arrow.png")
 dot = Image.open("../assets/dot.png")
 dia_arrow = Image.open("../assets/diastolic_arrow.png")
 
+# The sprites are opaque black on a fully transparent background, so they can be
+# stamped through a boolean mask rather than alpha blended. The blank sheet is opaque
+# grayscale, so the canvas is kept as a single-channel "L" array (a quarter of RGBA).
+sys_mask = np.asarray(sys_arrow)[..., 3] > 0
+dot_mask = np.asarray(dot)[..., 3] > 0
+dia_mask = np.asarray(dia_arrow)[..., 3] > 0
+sprite_masks: Dict[str, np.ndarray] = {
+    "systolic": sys_mask,
+    "heart_rate": dot_mask,
+    "diastolic": dia_mask,
+}
+
+
+@lru_cache(maxsize=4)
+def load_canvas(path: str, mtime: float) -> np.ndarray:
+    """Decodes a chart into a grayscale array once per (path, modification time)."""
+    return np.array(Image.open(path).convert("L"))
+
+
+def stamp_many(
+    canvas: np.ndarray, mask: np.ndarray, xs: np.ndarray, ys: np.ndarray
+) -> None:
+    """Writes black into a grayscale canvas wherever the sprite mask is set, at every (x, y).
+
+    All placements are scattered in a single fancy-indexed store rather than one slice per
+    sprite, so the cost no longer includes a Python-level iteration per detection.
+    """
+    mask_rows, mask_cols = np.nonzero(mask)
+    rows = (ys[:, None] + mask_rows).ravel()
+    cols = (xs[:, None] + mask_cols).ravel()
+    # Negative indices would wrap around to the far edge, so they are dropped like overflow.
+    in_bounds = (
+        (rows >= 0) & (rows < canvas.shape[0]) & (cols >= 0) & (cols < canvas.shape[1])
+    )
+    canvas[rows[in_bounds], cols[in_bounds]] = 0
+
+
+def draw_sprites(
+    background: Union[np.ndarray, Image.Image, str],
+    mask: np.ndarray,
+    detections: Union[np.ndarray, List[Tuple[int, int]]],
+) -> np.ndarray:
+    """Stamps a sprite mask at each detection, accepting a canvas array, an image, or a path."""
+    if isinstance(background, str):
+        background = load_canvas(background, os.path.getmtime(background)).copy()
+    elif isinstance(background, Image.Image):
+        background = np.array(background.convert("L"))
+    coords = np.asarray(detections, dtype=np.int32).reshape(-1, 2)
+    stamp_many(background, mask, coords[:, 0], coords[:, 1])
+    return background
+
+
+def render_chart(detections: Dict[str, np.ndarray]) -> bytes:
+    """Renders one chart from its systolic, heart_rate, and diastolic detections as PNG bytes."""
+    canvas = load_canvas(BLANK_SHEET_PATH, os.path.getmtime(BLANK_SHEET_PATH)).copy()
+    for name, mask in sprite_masks.items():
+        canvas = draw_sprites(canvas, mask, detections.get(name, np.empty((0, 2), np.int32)))
+    buffer = BytesIO()
+    # Fast deflate: a somewhat larger file in exchange for several times quicker encoding.
+    Image.fromarray(canvas).save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def render_charts(all_detections: List[Dict[str, np.ndarray]]) -> List[bytes]:
+    """Renders many independent charts across processes, preserving their order.
+
+    Each worker decodes the blank sheet once through load_canvas and reuses it for every
+    chart it renders.
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(render_chart, all_detections))
+
 
 if __name__ == "__main__":
 
-    sys_detections: list[tuple] = [(537, 1002), (597, 1042), (897, 1034)]
-    dot_detections: list[tuple] = [(542, 1052), (602, 1092), (902, 1251)]
-    dia_detections: list[tuple] = [(537, 1097), (597, 1137), (897, 1456)]
-    asset = Image.new(mode="RGBA", size=chart.size, color=(255, 255, 255, 0))
-
-    for coords in sys_detections:
-        asset.paste(im=sys_arrow, box=coords)
-        chart = Image.alpha_composite(chart, asset)
-    for coords in dot_detections:
-        asset.paste(im=dot, box=coords)
-        chart = Image.alpha_composite(chart, asset)
-    for coords in dia_detections:
-        asset.paste(im=dia_arrow, box=coords)
-        chart = Image.alpha_composite(chart, asset)
-
-    chart.save("output.png")
+    sys_detections: np.ndarray = np.array(
+        [(537, 1002), (597, 1042), (897, 1034)], dtype=np.int32
+    )
+    dot_detections: np.ndarray = np.array(
+        [(542, 1052), (602, 1092), (902, 1251)], dtype=np.int32
+    )
+    dia_detections: np.ndarray = np.array(
+        [(537, 1097), (597, 1137), (897, 1456)], dtype=np.int32
+    )
+
+    png = render_chart(
+        {
+            "systolic": sys_detections,
+            "heart_rate": dot_detections,
+            "diastolic": dia_detections,
+        }
+    )
+    with open("output.png", "wb") as f:
+        f.write(png)
@@ -1,12 +1,16 @@
 """Consolidates all the functionality for extracting data from charts into one function."""
 
 # Built-in imports
-from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 import json
-from operator import concat
+import os
 from pathlib import Path
 from PIL import Image
-from typing import Any, Dict, List, Tuple
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Type
+import warnings
 
 # Internal Imports
 from ..extraction.blood_pressure_and_heart_rate import (
@@ -15,8 +19,13 @@ from ..extraction.blood_pressure_and_heart_rate import (
 from ..extraction.checkboxes import extract_checkboxes
 from ..extraction.extraction_utilities import (
     combine_dictionaries,
+    detect_objects_in_regions,
     detect_objects_using_tiling,
+    find_search_regions,
+    get_landmark_centers,
     label_studio_to_bboxes,
+    reassemble_tile_detection_batches,
+    reassemble_tile_detections,
 )
 from ..extraction.inhaled_volatile import extract_inhaled_volatile
 from ..extraction.intraoperative_digit_boxes import (
@@ -38,80 +47,385 @@ from ..label_clustering.clustering_methods import (
 from ..label_clustering.isolate_labels import (
     isolate_blood_pressure_legend_bounding_boxes,
 )
+from ..object_detection_models.object_detection_model import (
+    BatchedObjectDetectionModel,
+    ObjectDetectionModel,
+)
 from ..object_detection_models.onnx_yolov11_detection import OnnxYolov11Detection
 from ..object_detection_models.onnx_yolov11_pose_single import OnnxYolov11PoseSingle
 from ..point_registration.homography import (
     find_homography,
-    transform_box,
-    transform_keypoint,
+    transform_boxes,
+    transform_keypoints,
 )
 from ..utilities.annotations import BoundingBox
-from ..utilities.detections import Detection
+from ..utilities.detections import Detection, DetectionBatch
+from ..utilities.image_conversion import pil_to_cv2
+from ..utilities.tiling import tile_image_array
 
 # External Imports
 import numpy as np
+import onnxruntime as ort
+from onnxruntime.capi.onnxruntime_pybind11_state import Fail as OrtFail
 
 
 PATH_TO_DATA: Path = (Path(__file__) / ".." / ".." / "data").resolve()
 PATH_TO_MODELS: Path = PATH_TO_DATA / "models"
 PATH_TO_MODEL_METADATA = PATH_TO_DATA / "model_metadata"
-MODEL_CONFIG: Dict = json.loads(open(str(PATH_TO_DATA / "config.json"), "r").read())
-INTRAOP_DOC_MODEL = OnnxYolov11Detection(
-    PATH_TO_MODELS / MODEL_CONFIG["intraoperative_document_landmarks"]["name"],
-    PATH_TO_MODEL_METADATA
-    / MODEL_CONFIG["intraoperative_document_landmarks"]["name"].replace(
-        ".onnx", ".json"
-    ),
-    MODEL_CONFIG["intraoperative_document_landmarks"]["imgsz"],
-    MODEL_CONFIG["intraoperative_document_landmarks"]["imgsz"],
-    lazy_loading=True,
-)
-PREOP_POSTOP_DOC_MODEL = OnnxYolov11Detection(
-    PATH_TO_MODELS / MODEL_CONFIG["preop_postop_document_landmarks"]["name"],
-    PATH_TO_MODEL_METADATA
-    / MODEL_CONFIG["preop_postop_document_landmarks"]["name"].replace(".onnx", ".json"),
-    MODEL_CONFIG["preop_postop_document_landmarks"]["imgsz"],
-    MODEL_CONFIG["preop_postop_document_landmarks"]["imgsz"],
-    lazy_loading=True,
-)
-NUMBERS_MODEL = OnnxYolov11Detection(
-    PATH_TO_MODELS / MODEL_CONFIG["numbers"]["name"],
-    PATH_TO_MODEL_METADATA / MODEL_CONFIG["numbers"]["name"].replace(".onnx", ".json"),
-    MODEL_CONFIG["numbers"]["imgsz"],
-    MODEL_CONFIG["numbers"]["imgsz"],
-    lazy_loading=True,
-)
-SYSTOLIC_MODEL = OnnxYolov11PoseSingle(
-    PATH_TO_MODELS / MODEL_CONFIG["systolic"]["name"],
-    PATH_TO_MODEL_METADATA / MODEL_CONFIG["systolic"]["name"].replace(".onnx", ".json"),
-    MODEL_CONFIG["systolic"]["imgsz"],
-    MODEL_CONFIG["systolic"]["imgsz"],
-    lazy_loading=True,
-)
-DIASTOLIC_MODEL = OnnxYolov11PoseSingle(
-    PATH_TO_MODELS / MODEL_CONFIG["diastolic"]["name"],
-    PATH_TO_MODEL_METADATA
-    / MODEL_CONFIG["diastolic"]["name"].replace(".onnx", ".json"),
-    MODEL_CONFIG["diastolic"]["imgsz"],
-    MODEL_CONFIG["diastolic"]["imgsz"],
-    lazy_loading=True,
+
+# Up to six models run at once (the intraoperative side), each in its own thread. Onnx runtime
+# releases the GIL while running, and the sessions share one process wide intra-op thread pool
+# (see configure_global_thread_pools) instead of each claiming threads for the same cores.
+N_PARALLEL_MODELS: int = 6
+MODEL_EXECUTOR: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=N_PARALLEL_MODELS)
+MODEL_LOCK: Lock = Lock()
+# Prefer the GPU when this onnx runtime build has one, and fall back to the CPU otherwise.
+EXECUTION_PROVIDERS: List[str] = [
+    provider
+    for provider in [
+        "TensorrtExecutionProvider",
+        "CUDAExecutionProvider",
+        "CPUExecutionProvider",
+    ]
+    if provider in ort.get_available_providers()
+]
+# Optimized graphs and TensorRT engines are only cached when the CHARTEXTRACTOR_CACHE_DIR
+# environment variable names a folder for them, since the package's own folder may not be
+# writable and may be shared by several processes.
+PATH_TO_CACHE: Optional[Path] = (
+    Path(os.environ["CHARTEXTRACTOR_CACHE_DIR"]).expanduser()
+    if os.environ.get("CHARTEXTRACTOR_CACHE_DIR")
+    else None
 )
-HEART_RATE_MODEL = OnnxYolov11PoseSingle(
-    PATH_TO_MODELS / MODEL_CONFIG["heart_rate"]["name"],
-    PATH_TO_MODEL_METADATA
-    / MODEL_CONFIG["heart_rate"]["name"].replace(".onnx", ".json"),
-    MODEL_CONFIG["heart_rate"]["imgsz"],
-    MODEL_CONFIG["heart_rate"]["imgsz"],
-    lazy_loading=True,
+# TensorRT builds its engines in half precision. Building an engine takes minutes, so they
+# are cached when there is a cache folder.
+PROVIDER_OPTIONS: Dict[str, Dict[str, Any]] = {
+    "TensorrtExecutionProvider": {"trt_fp16_enable": True},
+}
+if PATH_TO_CACHE is not None:
+    PROVIDER_OPTIONS["TensorrtExecutionProvider"].update(
+        {
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": str(PATH_TO_CACHE / "tensorrt"),
+        }
+    )
+
+# The document landmarks whose centers anchor each side's homography, and where those
+# landmarks sit on the scanned, perfect chart. These files never change at runtime.
+INTRAOP_CORNER_LANDMARK_NAMES: List[str] = [
+    "anesthesia_start",
+    "safety_checklist",
+    "lateral",
+    "units",
+]
+PREOP_POSTOP_CORNER_LANDMARK_NAMES: List[str] = [
+    "patient_profile",
+    "weight",
+    "signature",
+    "disposition",
+]
+INTRAOP_DESTINATION_LANDMARKS: List[BoundingBox] = label_studio_to_bboxes(
+    str(PATH_TO_DATA / "intraop_document_landmarks.json")
+)["unified_intraoperative_preoperative_flowsheet_v1_1_front.png"]
+PREOP_POSTOP_DESTINATION_LANDMARKS: List[BoundingBox] = label_studio_to_bboxes(
+    str(PATH_TO_DATA / "preoperative_document_landmarks.json")
+)["unified_intraoperative_preoperative_flowsheet_v1_1_back.png"]
+INTRAOP_DESTINATION_POINTS: List[Tuple[float, float]] = get_landmark_centers(
+    INTRAOP_DESTINATION_LANDMARKS, INTRAOP_CORNER_LANDMARK_NAMES
 )
-CHECKBOXES_MODEL = OnnxYolov11Detection(
-    PATH_TO_MODELS / MODEL_CONFIG["checkboxes"]["name"],
-    PATH_TO_MODEL_METADATA
-    / MODEL_CONFIG["checkboxes"]["name"].replace(".onnx", ".json"),
-    MODEL_CONFIG["checkboxes"]["imgsz"],
-    MODEL_CONFIG["checkboxes"]["imgsz"],
-    lazy_loading=True
+PREOP_POSTOP_DESTINATION_POINTS: List[Tuple[float, float]] = get_landmark_centers(
+    PREOP_POSTOP_DESTINATION_LANDMARKS, PREOP_POSTOP_CORNER_LANDMARK_NAMES
 )
+# Once a chart is corrected, its landmarks are only searched for this many pixels around where
+# the template has them, which leaves room for any error in the homography.
+LANDMARK_SEARCH_PADDING: int = 100
+# When every corner landmark is found with at least this confidence before correction, the
+# landmarks are remapped onto the corrected chart rather than detected a second time.
+CORNER_CONFIDENCE_THRESHOLD: float = 0.7
+
+# The wrapper class for each model in the config. Models are only built, and their metadata
+# only read, the first time get_model is called for them.
+MODEL_CLASSES: Dict[str, Type[ObjectDetectionModel]] = {
+    "intraoperative_document_landmarks": OnnxYolov11Detection,
+    "preop_postop_document_landmarks": OnnxYolov11Detection,
+    "numbers": OnnxYolov11Detection,
+    "checkboxes": OnnxYolov11Detection,
+    "systolic": OnnxYolov11PoseSingle,
+    "diastolic": OnnxYolov11PoseSingle,
+    "heart_rate": OnnxYolov11PoseSingle,
+}
+
+
+@lru_cache(maxsize=None)
+def get_model_config() -> Dict:
+    """Reads the model config file the first time it is needed.
+
+    Returns:
+        A dictionary mapping each model's name to its config.
+    """
+    with open(PATH_TO_DATA / "config.json", "r") as f:
+        return json.load(f)
+
+
+def get_model_weights_filepath(model_config: Dict) -> Path:
+    """Picks the weights file for a model, preferring quantized weights when they exist.
+
+    A model's config may name "int8_name" and "fp16_name" siblings of its full precision
+    "name" in the models folder. The first of those that exists on disk is used. If the config
+    also sets "precision" to "int8" or "fp16", that sibling is used instead. If it does not
+    exist, it is converted from the full precision weights into the cache folder the first
+    time it is needed.
+
+    Args:
+        `model_config` (Dict):
+            The model's entry in the model config.
+
+    Returns:
+        The path to the weights to load.
+    """
+    if model_config.get("precision") in ["int8", "fp16"]:
+        return get_reduced_precision_weights_filepath(model_config, model_config["precision"])
+    for name_key in ["int8_name", "fp16_name"]:
+        if name_key in model_config and (PATH_TO_MODELS / model_config[name_key]).exists():
+            return PATH_TO_MODELS / model_config[name_key]
+    return PATH_TO_MODELS / model_config["name"]
+
+
+def get_reduced_precision_weights_filepath(model_config: Dict, precision: str) -> Path:
+    """Gets a model's reduced precision weights, converting the full precision weights if needed.
+
+    Weights shipped in the models folder are used as they are. Otherwise the full precision
+    weights are converted into the cache folder, if one was given.
+
+    Args:
+        `model_config` (Dict):
+            The model's entry in the model config.
+        `precision` (str):
+            Either "int8" or "fp16".
+
+    Returns:
+        The path to the reduced precision weights, or to the full precision weights (with a
+        warning) if there are no reduced precision weights and they cannot be made.
+    """
+    full_precision_filepath: Path = PATH_TO_MODELS / model_config["name"]
+    reduced_precision_name: str = model_config.get(
+        f"{precision}_name", f"{full_precision_filepath.stem}.{precision}.onnx"
+    )
+    if (PATH_TO_MODELS / reduced_precision_name).exists():
+        return PATH_TO_MODELS / reduced_precision_name
+    if PATH_TO_CACHE is None:
+        warnings.warn(
+            f"{model_config['name']} is configured for {precision}, but there are no {precision} "
+            "weights and no CHARTEXTRACTOR_CACHE_DIR to convert them into. Using the full "
+            "precision weights."
+        )
+        return full_precision_filepath
+    reduced_precision_filepath: Path = (
+        PATH_TO_CACHE / "reduced_precision" / reduced_precision_name
+    )
+    if (
+        reduced_precision_filepath.exists()
+        and reduced_precision_filepath.stat().st_mtime
+        >= full_precision_filepath.stat().st_mtime
+    ):
+        return reduced_precision_filepath
+    # The weights are converted into a file only this process uses, then moved into place,
+    # so other processes never load partly written weights.
+    temporary_filepath: Path = reduced_precision_filepath.with_name(
+        f"{reduced_precision_filepath.stem}.{os.getpid()}.tmp.onnx"
+    )
+    try:
+        # Only imported here, since converting needs the quantization extra.
+        from ..object_detection_models.onnx_precision import (
+            convert_to_float16,
+            quantize_to_int8,
+        )
+
+        convert = quantize_to_int8 if precision == "int8" else convert_to_float16
+        reduced_precision_filepath.parent.mkdir(parents=True, exist_ok=True)
+        convert(full_precision_filepath, temporary_filepath)
+        os.replace(temporary_filepath, reduced_precision_filepath)
+    except (ImportError, OSError) as error:
+        temporary_filepath.unlink(missing_ok=True)
+        warnings.warn(
+            f"Could not convert {model_config['name']} to {precision} ({error}). Using the "
+            "full precision weights."
+        )
+        return full_precision_filepath
+    return reduced_precision_filepath
+
+
+@lru_cache(maxsize=None)
+def configure_global_thread_pools() -> bool:
+    """Creates the process wide onnx runtime thread pools the first time a model is built.
+
+    Onnx runtime only exposes this privately, and only allows it before its environment
+    exists, so either of those can leave the pools unconfigured.
+
+    Returns:
+        Whether the pools were created here, so that sessions may share them.
+    """
+    try:
+        from onnxruntime.capi._pybind_state import set_global_thread_pool_sizes
+
+        set_global_thread_pool_sizes(os.cpu_count() or 1, 1)
+    except (ImportError, OrtFail):
+        return False
+    return True
+
+
+def make_session_options(
+    optimized_model_filepath: Optional[Path] = None,
+) -> ort.SessionOptions:
+    """Creates the onnx runtime session options shared by every model.
+
+    Args:
+        `optimized_model_filepath` (Optional[Path]):
+            Where onnx runtime should save the model after optimizing its graph, so that later
+            runs can load it without optimizing again. Defaults to None, which saves nothing.
+
+    Returns:
+        The session options, which run on the shared global thread pool when there is one.
+    """
+    session_options: ort.SessionOptions = ort.SessionOptions()
+    # The layout optimizations that only ORT_ENABLE_ALL adds are specific to the machine, so
+    # a saved model stops at ORT_ENABLE_EXTENDED and they are redone cheaply when it's loaded.
+    session_options.graph_optimization_level = (
+        ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if optimized_model_filepath is None
+        else ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    )
+    session_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    if configure_global_thread_pools():
+        session_options.use_per_session_threads = False
+    else:
+        # Without the shared pools, the cores are split between the models that run at once.
+        session_options.intra_op_num_threads = max(
+            1, (os.cpu_count() or 1) // N_PARALLEL_MODELS
+        )
+    session_options.enable_mem_pattern = True
+    if optimized_model_filepath is not None:
+        session_options.optimized_model_filepath = str(optimized_model_filepath)
+    return session_options
+
+
+def get_optimized_model_filepath(model_weights_filepath: Path) -> Optional[Path]:
+    """Gets where the graph optimized copy of a model's weights is cached.
+
+    Optimized graphs can depend on the execution provider and the onnx runtime version
+    they were optimized with, so each pair gets its own copy.
+
+    Args:
+        `model_weights_filepath` (Path):
+            The path to the model's weights.
+
+    Returns:
+        The path to the optimized weights in the cache folder, or None if no cache folder
+        was given.
+    """
+    if PATH_TO_CACHE is None:
+        return None
+    provider: str = EXECUTION_PROVIDERS[0].replace("ExecutionProvider", "").lower()
+    return PATH_TO_CACHE / "optimized_models" / (
+        f"{model_weights_filepath.stem}.{provider}.ort{ort.__version__}.optimized.onnx"
+    )
+
+
+def save_optimized_model(
+    model_weights_filepath: Path,
+    optimized_model_filepath: Path,
+) -> bool:
+    """Optimizes a model's graph and saves it to the cache.
+
+    The graph is written to a file only this process uses, then moved into place, so
+    other processes never load a partly written model.
+
+    Args:
+        `model_weights_filepath` (Path):
+            The path to the model's weights.
+        `optimized_model_filepath` (Path):
+            Where to save the optimized weights.
+
+    Returns:
+        Whether the optimized weights were saved.
+    """
+    temporary_filepath: Path = optimized_model_filepath.with_name(
+        f"{optimized_model_filepath.name}.{os.getpid()}.tmp"
+    )
+    try:
+        optimized_model_filepath.parent.mkdir(parents=True, exist_ok=True)
+        ort.InferenceSession(
+            str(model_weights_filepath),
+            sess_options=make_session_options(temporary_filepath),
+            providers=EXECUTION_PROVIDERS,
+        )
+        os.replace(temporary_filepath, optimized_model_filepath)
+    except (OSError, OrtFail):
+        # The cache is only an optimization, so the model is loaded from its weights instead.
+        temporary_filepath.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def get_model(config_key: str) -> ObjectDetectionModel:
+    """Builds a model from its config the first time it is requested.
+
+    The model's weights are loaded lazily on its first detection. Both sides of a chart
+    can be digitized at once, so building is locked to keep each model a single instance.
+
+    Args:
+        `config_key` (str):
+            The name of the model's entry in the model config.
+
+    Returns:
+        The model, shared by every later call with the same config_key.
+    """
+    with MODEL_LOCK:
+        return build_model(config_key)
+
+
+@lru_cache(maxsize=None)
+def build_model(config_key: str) -> ObjectDetectionModel:
+    """Builds a model from its config, caching it for get_model.
+
+    Args:
+        `config_key` (str):
+            The name of the model's entry in the model config.
+
+    Returns:
+        The model.
+    """
+    model_config: Dict = get_model_config()[config_key]
+    model_weights_filepath: Path = get_model_weights_filepath(model_config)
+    optimized_model_filepath: Optional[Path] = get_optimized_model_filepath(
+        model_weights_filepath
+    )
+    # With a cache folder, the graph is optimized on the first run and saved, then later runs
+    # load the saved copy until the original weights are replaced. TensorRT compiles the
+    # original graph itself and caches the result, so it is never given a saved copy.
+    if (
+        optimized_model_filepath is not None
+        and EXECUTION_PROVIDERS[0] != "TensorrtExecutionProvider"
+    ):
+        is_cached: bool = (
+            optimized_model_filepath.exists()
+            and optimized_model_filepath.stat().st_mtime
+            >= model_weights_filepath.stat().st_mtime
+        )
+        if is_cached or save_optimized_model(model_weights_filepath, optimized_model_filepath):
+            model_weights_filepath = optimized_model_filepath
+    return MODEL_CLASSES[config_key](
+        model_weights_filepath,
+        PATH_TO_MODEL_METADATA / model_config["name"].replace(".onnx", ".json"),
+        model_config["imgsz"],
+        model_config["imgsz"],
+        lazy_loading=True,
+        session_options=make_session_options(),
+        providers=[
+            (provider, PROVIDER_OPTIONS.get(provider, {}))
+            for provider in EXECUTION_PROVIDERS
+        ],
+    )
 
 
 def digitize_sheet(intraop_image: Image.Image, preop_postop_image: Image.Image) -> Dict:
@@ -128,9 +442,17 @@ def digitize_sheet(intraop_image: Image.Image, preop_postop_image: Image.Image)
     Returns:
         A dictionary containing all the data from the anesthesia record.
     """
-    data = dict()
-    data.update(digitize_intraop_record(intraop_image))
-    data.update(digitize_preop_postop_record(preop_postop_image))
+    # The two sides are independent and spend most of their time in onnx runtime, which
+    # releases the GIL. Their model runs still share MODEL_EXECUTOR, so the per-session
+    # thread counts keep the machine from being oversubscribed.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        intraop_data = executor.submit(digitize_intraop_record, intraop_image)
+        preop_postop_data = executor.submit(
+            digitize_preop_postop_record, preop_postop_image
+        )
+        data = dict()
+        data.update(intraop_data.result())
+        data.update(preop_postop_data.result())
     return data
 
 
@@ -193,85 +515,18 @@ def run_intraoperative_models(intraop_image: Image.Image) -> Dict[str, List[Dete
             "heart_rate": [...],
         }
     """
-    detections_dict: Dict[str, List[Detection]] = dict()
-
-    # landmarks
-    landmark_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["intraoperative_document_landmarks"], intraop_image.size
-    )
-    detections_dict["landmarks"] = detect_objects_using_tiling(
-        intraop_image,
-        INTRAOP_DOC_MODEL,
-        landmark_tile_size,
-        landmark_tile_size,
-        MODEL_CONFIG["intraoperative_document_landmarks"]["horz_overlap_proportion"],
-        MODEL_CONFIG["intraoperative_document_landmarks"]["vert_overlap_proportion"],
-    )
-
-    # numbers
-    digit_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["numbers"], intraop_image.size
-    )
-    detections_dict["numbers"] = detect_objects_using_tiling(
+    return run_models_concurrently(
         intraop_image,
-        NUMBERS_MODEL,
-        digit_tile_size,
-        digit_tile_size,
-        MODEL_CONFIG["numbers"]["horz_overlap_proportion"],
-        MODEL_CONFIG["numbers"]["vert_overlap_proportion"],
-    )
-
-    # checkboxes
-    tile_size = compute_tile_size(MODEL_CONFIG["checkboxes"], intraop_image.size)
-    detections_dict["checkboxes"] = detect_objects_using_tiling(
-        intraop_image,
-        CHECKBOXES_MODEL,
-        tile_size,
-        tile_size,
-        MODEL_CONFIG["checkboxes"]["horz_overlap_proportion"],
-        MODEL_CONFIG["checkboxes"]["vert_overlap_proportion"],
-        nms_threshold=0.8,
-    )
-
-    # systolic
-    sys_tile_size: int = compute_tile_size(MODEL_CONFIG["systolic"], intraop_image.size)
-    detections_dict["systolic"] = detect_objects_using_tiling(
-        intraop_image.copy(),
-        SYSTOLIC_MODEL,
-        sys_tile_size,
-        sys_tile_size,
-        MODEL_CONFIG["systolic"]["horz_overlap_proportion"],
-        MODEL_CONFIG["systolic"]["vert_overlap_proportion"],
-    )
-
-    # diastolic
-    dia_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["diastolic"], intraop_image.size
-    )
-    detections_dict["diastolic"] = detect_objects_using_tiling(
-        intraop_image.copy(),
-        DIASTOLIC_MODEL,
-        dia_tile_size,
-        dia_tile_size,
-        MODEL_CONFIG["diastolic"]["horz_overlap_proportion"],
-        MODEL_CONFIG["diastolic"]["vert_overlap_proportion"],
-    )
-
-    # heart rate
-    hr_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["heart_rate"], intraop_image.size
-    )
-    detections_dict["heart_rate"] = detect_objects_using_tiling(
-        intraop_image.copy(),
-        HEART_RATE_MODEL,
-        hr_tile_size,
-        hr_tile_size,
-        MODEL_CONFIG["heart_rate"]["horz_overlap_proportion"],
-        MODEL_CONFIG["heart_rate"]["vert_overlap_proportion"],
+        {
+            "landmarks": ("intraoperative_document_landmarks", {}),
+            "numbers": ("numbers", {}),
+            "checkboxes": ("checkboxes", {"nms_threshold": 0.8}),
+            "systolic": ("systolic", {}),
+            "diastolic": ("diastolic", {}),
+            "heart_rate": ("heart_rate", {}),
+        },
     )
 
-    return detections_dict
-
 
 def run_preoperative_postoperative_models(
     preop_postop_image: Image.Image,
@@ -292,48 +547,238 @@ def run_preoperative_postoperative_models(
             "checkboxes": [...],
         }
     """
-    detections_dict: Dict[str, List[Detection]] = dict()
-
-    # landmarks
-    landmark_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["preop_postop_document_landmarks"],
-        preop_postop_image.size,
-    )
-    detections_dict["landmarks"] = detect_objects_using_tiling(
+    return run_models_concurrently(
         preop_postop_image,
-        PREOP_POSTOP_DOC_MODEL,
-        landmark_tile_size,
-        landmark_tile_size,
-        MODEL_CONFIG["preop_postop_document_landmarks"]["horz_overlap_proportion"],
-        MODEL_CONFIG["preop_postop_document_landmarks"]["vert_overlap_proportion"],
+        {
+            "landmarks": ("preop_postop_document_landmarks", {}),
+            "numbers": ("numbers", {}),
+            "checkboxes": ("checkboxes", {"nms_threshold": 0.8}),
+        },
     )
 
-    # numbers
-    digit_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["numbers"], preop_postop_image.size
-    )
-    detections_dict["numbers"] = detect_objects_using_tiling(
-        preop_postop_image,
-        NUMBERS_MODEL,
-        digit_tile_size,
-        digit_tile_size,
-        MODEL_CONFIG["numbers"]["horz_overlap_proportion"],
-        MODEL_CONFIG["numbers"]["vert_overlap_proportion"],
+
+def run_models_concurrently(
+    image: Image.Image,
+    model_runs: Dict[str, Tuple[str, Dict[str, Any]]],
+) -> Dict[str, List[Detection]]:
+    """Runs several models on the same image at once using the shared model thread pool.
+
+    Models that tile the image the same way and take the same input size share a single
+    tiling and preprocessing pass, so each tile is cropped, resized, and normalized once.
+    The tiles are preprocessed one batch at a time (see SharedTileBatches), so memory stays
+    bounded by the models' batch_size however many tiles there are.
+
+    Args:
+        `image` (Image.Image):
+            The image to detect on.
+        `model_runs` (Dict[str, Tuple[str, Dict[str, Any]]]):
+            Maps each output key to the name of the model's entry in the model config and
+            any extra keyword arguments for detect_objects_on_tiles.
+
+    Returns:
+        A dictionary mapping each key in model_runs to that model's detections.
+    """
+    # Decode the image once, before handing it to the worker threads, which then only slice it.
+    image_array: np.ndarray = pil_to_cv2(image)
+    run_tilings: Dict[str, Tuple[int, float, float, int]] = {
+        key: get_tiling_parameters(config_key, image.size)
+        for key, (config_key, _) in model_runs.items()
+    }
+    tiled_images: Dict[Tuple[int, float, float, int], List[List[np.ndarray]]] = {
+        tiling: tile_image_array(image_array, tiling[0], tiling[0], *tiling[1:3])
+        for tiling in set(run_tilings.values())
+    }
+    shared_batches: Dict[Tuple[int, float, float, int], SharedTileBatches] = dict()
+    for key, (config_key, _) in model_runs.items():
+        model: ObjectDetectionModel = get_model(config_key)
+        if isinstance(model, BatchedObjectDetectionModel):
+            tiles: List[np.ndarray] = [
+                tile for row in tiled_images[run_tilings[key]] for tile in row
+            ]
+            shared_batches.setdefault(
+                run_tilings[key], SharedTileBatches(tiles, model)
+            ).n_models += 1
+    futures = {
+        key: MODEL_EXECUTOR.submit(
+            detect_objects_on_tiles,
+            get_model(config_key),
+            tiled_images[run_tilings[key]],
+            shared_batches.get(run_tilings[key]),
+            *run_tilings[key][:3],
+            **kwargs,
+        )
+        for key, (config_key, kwargs) in model_runs.items()
+    }
+    return {key: future.result() for key, future in futures.items()}
+
+
+@lru_cache(maxsize=64)
+def get_tiling_parameters(
+    config_key: str, image_size: Tuple[int, int]
+) -> Tuple[int, float, float, int]:
+    """Gets the tile size, overlaps, and input size a model's config gives for an image.
+
+    Cached, since nearly every image of a given side of the chart has the same size.
+
+    Args:
+        `config_key` (str):
+            The name of the model's entry in the model config.
+        `image_size` (Tuple[int, int]):
+            The size of the image being tiled.
+
+    Returns:
+        A tuple of the tile size, horizontal overlap, vertical overlap, and model input size.
+    """
+    model_config: Dict = get_model_config()[config_key]
+    return (
+        get_tile_size(config_key, image_size),
+        model_config["horz_overlap_proportion"],
+        model_config["vert_overlap_proportion"],
+        model_config["imgsz"],
     )
 
-    # checkboxes
-    tile_size = compute_tile_size(MODEL_CONFIG["checkboxes"], preop_postop_image.size)
-    detections_dict["checkboxes"] = detect_objects_using_tiling(
-        preop_postop_image,
-        CHECKBOXES_MODEL,
+
+def run_model_with_config(
+    image: Image.Image, config_key: str, **kwargs
+) -> List[Detection]:
+    """Runs a single model over an image using the tiling its model config gives.
+
+    Args:
+        `image` (Image.Image):
+            The image to detect on.
+        `config_key` (str):
+            The name of the model's entry in the model config.
+        `kwargs`:
+            Extra keyword arguments for detect_objects_using_tiling, like nms_threshold.
+
+    Returns:
+        The model's detections on the image.
+    """
+    tile_size, horz_overlap, vert_overlap, _ = get_tiling_parameters(
+        config_key, image.size
+    )
+    return detect_objects_using_tiling(
+        image,
+        get_model(config_key),
         tile_size,
         tile_size,
-        MODEL_CONFIG["checkboxes"]["horz_overlap_proportion"],
-        MODEL_CONFIG["checkboxes"]["vert_overlap_proportion"],
-        nms_threshold=0.8,
+        horz_overlap,
+        vert_overlap,
+        **kwargs,
     )
 
-    return detections_dict
+
+class SharedTileBatches:
+    """Preprocesses an image's tiles one batch at a time for the models that share them.
+
+    Each batch is preprocessed for whichever model asks for it first and dropped once every
+    model has taken it, so the preprocessed tiles are never all held at once.
+    """
+
+    def __init__(self, tiles: List[np.ndarray], model: BatchedObjectDetectionModel):
+        """Initializes the `SharedTileBatches`.
+
+        Args:
+            `tiles` (List[np.ndarray]):
+                The tiles, in row-major order.
+            `model` (BatchedObjectDetectionModel):
+                A model whose input size matches every model the tiles will be given to.
+                Its batch_size sets how many tiles are preprocessed at a time.
+        """
+        self.tiles: List[np.ndarray] = tiles
+        self.model: BatchedObjectDetectionModel = model
+        self.batch_size: int = model.batch_size
+        self.n_models: int = 0
+        self.batches: Dict[int, np.ndarray] = dict()
+        self.remaining_uses: Dict[int, int] = dict()
+        self.lock: Lock = Lock()
+
+    def get_batch(self, start: int) -> np.ndarray:
+        """Gets the preprocessed batch of tiles beginning at a tile index.
+
+        Every model that shares the tiles must take each batch exactly once.
+
+        Args:
+            `start` (int):
+                The index of the batch's first tile. Must be a multiple of batch_size.
+
+        Returns:
+            The preprocessed tiles from start to start + batch_size.
+        """
+        with self.lock:
+            if start not in self.batches:
+                self.batches[start] = self.model.preprocess_images(
+                    self.tiles[start : start + self.batch_size]
+                )
+                self.remaining_uses[start] = self.n_models
+            batch: np.ndarray = self.batches[start]
+            self.remaining_uses[start] -= 1
+            if self.remaining_uses[start] == 0:
+                del self.batches[start]
+                del self.remaining_uses[start]
+            return batch
+
+
+def detect_objects_on_tiles(
+    model: ObjectDetectionModel,
+    image_tiles: List[List[np.ndarray]],
+    shared_batches: Optional[SharedTileBatches],
+    tile_size: int,
+    horizontal_overlap_ratio: float,
+    vertical_overlap_ratio: float,
+    minimum_confidence: float = 0.5,
+    **kwargs,
+) -> List[Detection]:
+    """Runs a model on an image's tiles and reassembles the detections.
+
+    Args:
+        `model` (ObjectDetectionModel):
+            The model to detect with.
+        `image_tiles` (List[List[np.ndarray]]):
+            The rows of tiles.
+        `shared_batches` (Optional[SharedTileBatches]):
+            The tiles' preprocessed batches, shared with the other models of the same input
+            size. None for models that do not implement BatchedObjectDetectionModel, which
+            are given the tiles directly.
+        `tile_size` (int):
+            The width and height of each tile.
+        `horizontal_overlap_ratio` (float):
+            The amount of left-right overlap between tiles.
+        `vertical_overlap_ratio` (float):
+            The amount of top-bottom overlap between tiles.
+        `minimum_confidence` (float):
+            The confidence below which detections are culled. Defaults to 0.5.
+        `**kwargs`:
+            Extra keyword arguments passed on to the reassembly, like nms_threshold.
+
+    Returns:
+        The model's detections on the full image.
+    """
+    tiles: List[np.ndarray] = [tile for row in image_tiles for tile in row]
+    row_lengths: List[int] = [len(row) for row in image_tiles]
+    tiling: Tuple[int, int, float, float] = (
+        tile_size,
+        tile_size,
+        horizontal_overlap_ratio,
+        vertical_overlap_ratio,
+    )
+    if shared_batches is None or not isinstance(model, BatchedObjectDetectionModel):
+        return reassemble_tile_detections(
+            model(tiles, confidence=minimum_confidence), row_lengths, *tiling, **kwargs
+        )
+    step: int = shared_batches.batch_size
+    tile_detections: List[DetectionBatch] = [
+        detection_batch
+        for start in range(0, len(tiles), step)
+        for detection_batch in model.detect_preprocessed_batches(
+            shared_batches.get_batch(start),
+            [tile.shape for tile in tiles[start : start + step]],
+            confidence=minimum_confidence,
+        )
+    ]
+    return reassemble_tile_detection_batches(
+        tile_detections, row_lengths, *tiling, **kwargs
+    )
 
 
 def assign_meaning_to_detections(
@@ -387,15 +832,7 @@ def assign_meaning_to_intraoperative_detections(
     for key, detections in intraop_detections_dict.items():
         if len(detections) == 0:
             continue
-        remap_func = (
-            transform_box
-            if isinstance(detections[0].annotation, BoundingBox)
-            else transform_keypoint
-        )
-        corrected_detections_dict[key] = [
-            Detection(remap_func(det.annotation, h), det.confidence)
-            for det in detections
-        ]
+        corrected_detections_dict[key] = remap_detections(detections, h)
 
     extracted_data: Dict[str, Any] = dict()
 
@@ -431,14 +868,13 @@ def assign_meaning_to_intraoperative_detections(
     )
 
     # extract bp and hr
-    bp_and_hr_dets = reduce(
-        concat,
-        [
-            corrected_detections_dict["systolic"],
-            corrected_detections_dict["diastolic"],
-            corrected_detections_dict["heart_rate"],
-        ],
-        list(),
+    # Categories with no detections are skipped above, so they may be missing here.
+    bp_and_hr_dets: List[Detection] = list(
+        chain(
+            corrected_detections_dict.get("systolic", []),
+            corrected_detections_dict.get("diastolic", []),
+            corrected_detections_dict.get("heart_rate", []),
+        )
     )
 
     extracted_data["bp_and_hr"] = extract_heart_rate_and_blood_pressure(
@@ -488,15 +924,7 @@ def assign_meaning_to_preoperative_postoperative_detections(
     for key, detections in preop_postop_detections_dict.items():
         if len(detections) == 0:
             continue
-        remap_func = (
-            transform_box
-            if isinstance(detections[0].annotation, BoundingBox)
-            else transform_keypoint
-        )
-        corrected_detections_dict[key] = [
-            Detection(remap_func(det.annotation, h), det.confidence)
-            for det in detections
-        ]
+        corrected_detections_dict[key] = remap_detections(detections, h)
 
     extracted_data: Dict[str, Any] = dict()
 
@@ -511,6 +939,34 @@ def assign_meaning_to_preoperative_postoperative_detections(
     return extracted_data
 
 
+def remap_detections(
+    detections: List[Detection], homography_matrix: np.ndarray
+) -> List[Detection]:
+    """Remaps a list of detections that all share an annotation type with a homography.
+
+    Args:
+        detections (List[Detection]):
+            The detections to remap. Must all be BoundingBoxes or all be Keypoints.
+        homography_matrix (np.ndarray):
+            The homography matrix to remap with.
+
+    Returns:
+        The remapped detections, with their confidences unchanged.
+    """
+    remap_func = (
+        transform_boxes
+        if isinstance(detections[0].annotation, BoundingBox)
+        else transform_keypoints
+    )
+    remapped_annotations = remap_func(
+        [det.annotation for det in detections], homography_matrix
+    )
+    return [
+        Detection(annotation, det.confidence)
+        for annotation, det in zip(remapped_annotations, detections)
+    ]
+
+
 def digitize_intraop_record(image: Image.Image) -> Dict:
     """Digitizes the intraoperative side of a paper anesthesia record.
 
@@ -523,45 +979,31 @@ def digitize_intraop_record(image: Image.Image) -> Dict:
         A dictionary containing all the data from the intraoperative side of
         the paper anesthesia record.
     """
-    landmark_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["intraoperative_document_landmarks"], image.size
-    )
-    uncorrected_document_landmark_detections: List[Detection] = (
-        detect_objects_using_tiling(
-            image,
-            INTRAOP_DOC_MODEL,
-            landmark_tile_size,
-            landmark_tile_size,
-            MODEL_CONFIG["intraoperative_document_landmarks"][
-                "horz_overlap_proportion"
-            ],
-            MODEL_CONFIG["intraoperative_document_landmarks"][
-                "vert_overlap_proportion"
-            ],
-        )
+    uncorrected_document_landmark_detections: List[Detection] = run_model_with_config(
+        image, "intraoperative_document_landmarks"
     )
     image: Image.Image = homography_intraoperative_chart(
         image,
         uncorrected_document_landmark_detections,
     )
-    document_landmark_detections: List[Detection] = detect_objects_using_tiling(
+    landmark_future = MODEL_EXECUTOR.submit(
+        find_corrected_intraoperative_landmarks,
         image,
-        INTRAOP_DOC_MODEL,
-        landmark_tile_size,
-        landmark_tile_size,
-        MODEL_CONFIG["intraoperative_document_landmarks"]["horz_overlap_proportion"],
-        MODEL_CONFIG["intraoperative_document_landmarks"]["vert_overlap_proportion"],
+        uncorrected_document_landmark_detections,
     )
-
-    digit_tile_size: int = compute_tile_size(MODEL_CONFIG["numbers"], image.size)
-    digit_detections: List[Detection] = detect_objects_using_tiling(
+    detections: Dict[str, List[Detection]] = run_models_concurrently(
         image,
-        NUMBERS_MODEL,
-        digit_tile_size,
-        digit_tile_size,
-        MODEL_CONFIG["numbers"]["horz_overlap_proportion"],
-        MODEL_CONFIG["numbers"]["vert_overlap_proportion"],
+        {
+            "numbers": ("numbers", {}),
+            "checkboxes": ("checkboxes", {"nms_threshold": 0.8}),
+            "systolic": ("systolic", {}),
+            "diastolic": ("diastolic", {}),
+            "heart_rate": ("heart_rate", {}),
+        },
     )
+    detections["landmarks"] = landmark_future.result()
+    document_landmark_detections: List[Detection] = detections["landmarks"]
+    digit_detections: List[Detection] = detections["numbers"]
 
     # extract drug code and surgical timing
     codes: Dict = {"codes": extract_drug_codes(digit_detections, *image.size)}
@@ -591,7 +1033,11 @@ def digitize_intraop_record(image: Image.Image) -> Dict:
 
     # extract bp and hr
     bp_and_hr: Dict = {
-        "bp_and_hr": make_bp_and_hr_detections(image, time_clusters, mmhg_clusters)
+        "bp_and_hr": extract_heart_rate_and_blood_pressure(
+            detections["systolic"] + detections["diastolic"] + detections["heart_rate"],
+            time_clusters,
+            mmhg_clusters,
+        )
     }
 
     # extract physiological indicators
@@ -606,7 +1052,9 @@ def digitize_intraop_record(image: Image.Image) -> Dict:
 
     # extract checkboxes
     checkboxes: Dict = {
-        "intraoperative_checkboxes": make_intraop_checkbox_detections(image)
+        "intraoperative_checkboxes": extract_checkboxes(
+            detections["checkboxes"], "intraoperative", *image.size
+        )
     }
 
     return combine_dictionaries(
@@ -622,6 +1070,81 @@ def digitize_intraop_record(image: Image.Image) -> Dict:
     )
 
 
+def find_corrected_intraoperative_landmarks(
+    corrected_image: Image.Image,
+    uncorrected_landmark_detections: List[Detection],
+) -> List[Detection]:
+    """Finds the document landmarks on a corrected intraoperative chart.
+
+    If the landmarks found before correction include every corner with high confidence, the
+    homography that corrected the chart is trusted and those landmarks are remapped with it.
+    Otherwise, the corrected image lines up with the template closely enough that the
+    landmarks are only searched for near where the template has them.
+
+    Args:
+        `corrected_image` (Image.Image):
+            The intraoperative image after the homography.
+        `uncorrected_landmark_detections` (List[Detection]):
+            The landmarks found on the image before the homography.
+
+    Returns:
+        The document landmarks on the corrected image.
+    """
+    if has_confident_corners(
+        uncorrected_landmark_detections, INTRAOP_CORNER_LANDMARK_NAMES
+    ):
+        return remap_detections(
+            uncorrected_landmark_detections,
+            create_intraoperative_homography_matrix(uncorrected_landmark_detections),
+        )
+    landmark_tiling: Tuple[int, float, float, int] = get_tiling_parameters(
+        "intraoperative_document_landmarks", corrected_image.size
+    )
+    return detect_objects_in_regions(
+        corrected_image,
+        get_model("intraoperative_document_landmarks"),
+        find_search_regions(
+            INTRAOP_DESTINATION_LANDMARKS,
+            LANDMARK_SEARCH_PADDING,
+            landmark_tiling[0],
+            *corrected_image.size,
+        ),
+        landmark_tiling[0],
+        landmark_tiling[0],
+        *landmark_tiling[1:3],
+    )
+
+
+def has_confident_corners(
+    landmark_detections: List[Detection],
+    corner_landmark_names: List[str],
+    minimum_confidence: float = CORNER_CONFIDENCE_THRESHOLD,
+) -> bool:
+    """Checks whether every corner landmark used for the homography is confidently detected.
+
+    Like get_landmark_centers, only the first detection of each corner is considered.
+
+    Args:
+        `landmark_detections` (List[Detection]):
+            The detected landmarks.
+        `corner_landmark_names` (List[str]):
+            The categories of the corner landmarks.
+        `minimum_confidence` (float):
+            The lowest confidence a corner can have. Defaults to CORNER_CONFIDENCE_THRESHOLD.
+
+    Returns:
+        True if every corner was detected and its first detection meets minimum_confidence.
+    """
+    corner_confidences: Dict[str, float] = dict()
+    for det in landmark_detections:
+        if det.annotation.category in corner_landmark_names:
+            corner_confidences.setdefault(det.annotation.category, det.confidence)
+    return all(
+        corner_confidences.get(name, 0.0) >= minimum_confidence
+        for name in corner_landmark_names
+    )
+
+
 def digitize_preop_postop_record(image: Image.Image) -> Dict:
     """Digitizes the preoperative/postoperative side of a paper anesthesia record.
 
@@ -634,33 +1157,26 @@ def digitize_preop_postop_record(image: Image.Image) -> Dict:
         A dictionary containing all the data from the preoperative/postoperative
         side of the paper anesthesia record.
     """
-    landmark_tile_size: int = compute_tile_size(
-        MODEL_CONFIG["preop_postop_document_landmarks"],
-        image.size,
-    )
-    document_landmark_detections: List[Detection] = detect_objects_using_tiling(
-        image,
-        PREOP_POSTOP_DOC_MODEL,
-        landmark_tile_size,
-        landmark_tile_size,
-        MODEL_CONFIG["preop_postop_document_landmarks"]["horz_overlap_proportion"],
-        MODEL_CONFIG["preop_postop_document_landmarks"]["vert_overlap_proportion"],
+    document_landmark_detections: List[Detection] = run_model_with_config(
+        image, "preop_postop_document_landmarks"
     )
     image: Image.Image = homography_preoperative_chart(
         image, document_landmark_detections
     )
-    digit_tile_size: int = compute_tile_size(MODEL_CONFIG["numbers"], image.size)
-    digit_detections: List[Detection] = detect_objects_using_tiling(
+    # The landmarks are only needed for the homography, so only the digit and checkbox
+    # models are run on the corrected image.
+    detections: Dict[str, List[Detection]] = run_models_concurrently(
         image,
-        NUMBERS_MODEL,
-        digit_tile_size,
-        digit_tile_size,
-        MODEL_CONFIG["numbers"]["horz_overlap_proportion"],
-        MODEL_CONFIG["numbers"]["vert_overlap_proportion"],
+        {
+            "numbers": ("numbers", {}),
+            "checkboxes": ("checkboxes", {"nms_threshold": 0.8}),
+        },
     )
-    digit_data = extract_preop_postop_digit_data(digit_detections, *image.size)
+    digit_data = extract_preop_postop_digit_data(detections["numbers"], *image.size)
     checkbox_data = {
-        "preoperative_checkboxes": make_preop_postop_checkbox_detections(image)
+        "preoperative_checkboxes": extract_checkboxes(
+            detections["checkboxes"], "preoperative", *image.size
+        )
     }
     return combine_dictionaries([digit_data, checkbox_data])
 
@@ -668,7 +1184,7 @@ def digitize_preop_postop_record(image: Image.Image) -> Dict:
 def create_homography_matrix(
     landmark_detections: List[Detection],
     corner_landmark_names: List[str],
-    destination_landmarks: List[BoundingBox],
+    destination_points: List[Tuple[float, float]],
 ) -> np.ndarray:
     """Creates a homography matrix from the corner landmarks.
 
@@ -677,37 +1193,17 @@ def create_homography_matrix(
             The list of detected landmarks.
         corner_landmark_names (List[str]):
             The list of names that match categories from the landmark detections.
-        destination_landmarks (List[BoundingBox]):
-            The landmark locations on the perfect, scanned image.
+        destination_points (List[Tuple[float, float]]):
+            The centers of the corner landmarks on the perfect, scanned image, sorted by name.
 
     Returns:
         A homography matrix that linearly transforms points from the original image to the
         scanned, perfect image.
     """
-    dest_points = [
-        bb.center
-        for bb in sorted(
-            list(
-                filter(
-                    lambda x: x.category in corner_landmark_names, destination_landmarks
-                )
-            ),
-            key=lambda bb: bb.category,
-        )
-    ]
-    src_points = [
-        bb.annotation.center
-        for bb in sorted(
-            list(
-                filter(
-                    lambda x: x.annotation.category in corner_landmark_names,
-                    landmark_detections,
-                )
-            ),
-            key=lambda bb: bb.annotation.category,
-        )
-    ]
-    return find_homography(src_points, dest_points)
+    src_points = get_landmark_centers(
+        [det.annotation for det in landmark_detections], corner_landmark_names
+    )
+    return find_homography(src_points, destination_points)
 
 
 def create_intraoperative_homography_matrix(
@@ -723,17 +1219,8 @@ def create_intraoperative_homography_matrix(
         A homography matrix that linearly transforms points from the original image to the
         scanned, perfect image.
     """
-    corner_landmark_names: List[str] = [
-        "anesthesia_start",
-        "safety_checklist",
-        "lateral",
-        "units",
-    ]
-    dst_landmarks: List[BoundingBox] = label_studio_to_bboxes(
-        str(PATH_TO_DATA / "intraop_document_landmarks.json")
-    )["unified_intraoperative_preoperative_flowsheet_v1_1_front.png"]
     return create_homography_matrix(
-        landmark_detections, corner_landmark_names, dst_landmarks
+        landmark_detections, INTRAOP_CORNER_LANDMARK_NAMES, INTRAOP_DESTINATION_POINTS
     )
 
 
@@ -750,17 +1237,10 @@ def create_preoperative_postoperative_homography_matrix(
         A homography matrix that linearly transforms points from the original image to the
         scanned, perfect image.
     """
-    corner_landmark_names: List[str] = [
-        "patient_profile",
-        "weight",
-        "signature",
-        "disposition",
-    ]
-    dst_landmarks: List[BoundingBox] = label_studio_to_bboxes(
-        str(PATH_TO_DATA / "preoperative_document_landmarks.json")
-    )["unified_intraoperative_preoperative_flowsheet_v1_1_back.png"]
     return create_homography_matrix(
-        landmark_detections, corner_landmark_names, dst_landmarks
+        landmark_detections,
+        PREOP_POSTOP_CORNER_LANDMARK_NAMES,
+        PREOP_POSTOP_DESTINATION_POINTS,
     )
 
 
@@ -779,38 +1259,13 @@ def homography_intraoperative_chart(
     Returns:
         An image that is warped to correct the locations of objects on the image.
     """
-    corner_landmark_names: List[str] = [
-        "anesthesia_start",
-        "safety_checklist",
-        "lateral",
-        "units",
-    ]
-    dst_landmarks = label_studio_to_bboxes(
-        str(PATH_TO_DATA / "intraop_document_landmarks.json")
-    )["unified_intraoperative_preoperative_flowsheet_v1_1_front.png"]
-
-    dest_points = [
-        bb.center
-        for bb in sorted(
-            list(filter(lambda x: x.category in corner_landmark_names, dst_landmarks)),
-            key=lambda bb: bb.category,
-        )
-    ]
-    src_points = [
-        bb.annotation.center
-        for bb in sorted(
-            list(
-                filter(
-                    lambda x: x.annotation.category in corner_landmark_names,
-                    intraop_document_detections,
-                )
-            ),
-            key=lambda bb: bb.annotation.category,
-        )
-    ]
+    src_points = get_landmark_centers(
+        [det.annotation for det in intraop_document_detections],
+        INTRAOP_CORNER_LANDMARK_NAMES,
+    )
     return homography_transform(
         image,
-        dest_points=dest_points,
+        dest_points=INTRAOP_DESTINATION_POINTS,
         src_points=src_points,
         original_image_size=(3300, 2550),
     )
@@ -831,43 +1286,34 @@ def homography_preoperative_chart(
     Returns:
         An image that is warped to correct the locations of objects on the image.
     """
-    corner_landmark_names: List[str] = [
-        "patient_profile",
-        "weight",
-        "signature",
-        "disposition",
-    ]
-    dst_landmarks = label_studio_to_bboxes(
-        str(PATH_TO_DATA / "preoperative_document_landmarks.json")
-    )["unified_intraoperative_preoperative_flowsheet_v1_1_back.png"]
-
-    dest_points = [
-        bb.center
-        for bb in sorted(
-            list(filter(lambda x: x.category in corner_landmark_names, dst_landmarks)),
-            key=lambda bb: bb.category,
-        )
-    ]
-    src_points = [
-        bb.annotation.center
-        for bb in sorted(
-            list(
-                filter(
-                    lambda x: x.annotation.category in corner_landmark_names,
-                    preop_document_detections,
-                )
-            ),
-            key=lambda bb: bb.annotation.category,
-        )
-    ]
+    src_points = get_landmark_centers(
+        [det.annotation for det in preop_document_detections],
+        PREOP_POSTOP_CORNER_LANDMARK_NAMES,
+    )
     return homography_transform(
         image,
-        dest_points=dest_points,
+        dest_points=PREOP_POSTOP_DESTINATION_POINTS,
         src_points=src_points,
         original_image_size=(3300, 2550),
     )
 
 
+@lru_cache(maxsize=64)
+def get_tile_size(config_key: str, image_size: Tuple[int, int]) -> int:
+    """Finds a model's tile size for an image size, caching the result.
+
+    Args:
+        config_key (str):
+            The name of the model's entry in the model config.
+        image_size (Tuple[int, int]):
+            The size of the image being tiled.
+
+    Returns:
+        The width and height of the model's tiles.
+    """
+    return compute_tile_size(get_model_config()[config_key], image_size)
+
+
 def compute_tile_size(model_config: Dict, image_size: Tuple[int, int]) -> int:
     """Finds the tile size for a model based on how its training dataset was generated.
 
@@ -904,36 +1350,16 @@ def make_bp_and_hr_detections(
     Returns:
         A dictionary mapping timestamps to values for systolic, diastolic, and heart rate.
     """
-    sys_tile_size: int = compute_tile_size(MODEL_CONFIG["systolic"], image.size)
-    dia_tile_size: int = compute_tile_size(MODEL_CONFIG["diastolic"], image.size)
-    hr_tile_size: int = compute_tile_size(MODEL_CONFIG["heart_rate"], image.size)
-
-    sys_dets: List[Detection] = detect_objects_using_tiling(
-        image.copy(),
-        SYSTOLIC_MODEL,
-        sys_tile_size,
-        sys_tile_size,
-        MODEL_CONFIG["systolic"]["horz_overlap_proportion"],
-        MODEL_CONFIG["systolic"]["vert_overlap_proportion"],
-    )
-    dia_dets: List[Detection] = detect_objects_using_tiling(
-        image.copy(),
-        DIASTOLIC_MODEL,
-        dia_tile_size,
-        dia_tile_size,
-        MODEL_CONFIG["diastolic"]["horz_overlap_proportion"],
-        MODEL_CONFIG["diastolic"]["vert_overlap_proportion"],
-    )
-    hr_dets: List[Detection] = detect_objects_using_tiling(
-        image.copy(),
-        HEART_RATE_MODEL,
-        hr_tile_size,
-        hr_tile_size,
-        MODEL_CONFIG["heart_rate"]["horz_overlap_proportion"],
-        MODEL_CONFIG["heart_rate"]["vert_overlap_proportion"],
-    )
-
-    dets: List[Detection] = sys_dets + dia_dets + hr_dets
+    # The three models are independent, so they run at once on the shared model thread pool.
+    detections: Dict[str, List[Detection]] = run_models_concurrently(
+        image,
+        {
+            "systolic": ("systolic", {}),
+            "diastolic": ("diastolic", {}),
+            "heart_rate": ("heart_rate", {}),
+        },
+    )
+    dets: List[Detection] = list(chain.from_iterable(detections.values()))
     bp_and_hr = extract_heart_rate_and_blood_pressure(
         dets, time_clusters, mmhg_clusters
     )
@@ -950,15 +1376,8 @@ def make_intraop_checkbox_detections(image: Image.Image) -> Dict:
     Returns:
         A dictionary mapping names of checkboxes to a "checked" or "unchecked" state.
     """
-    tile_size = compute_tile_size(MODEL_CONFIG["checkboxes"], image.size)
-    detections: List[Detection] = detect_objects_using_tiling(
-        image,
-        CHECKBOXES_MODEL,
-        tile_size,
-        tile_size,
-        MODEL_CONFIG["checkboxes"]["horz_overlap_proportion"],
-        MODEL_CONFIG["checkboxes"]["vert_overlap_proportion"],
-        nms_threshold=0.8,
+    detections: List[Detection] = run_model_with_config(
+        image, "checkboxes", nms_threshold=0.8
     )
     intraop_checkboxes = extract_checkboxes(
         detections,
@@ -979,15 +1398,8 @@ def make_preop_postop_checkbox_detections(image: Image.Image):
     Returns:
         A dictionary mapping names of checkboxes to a "checked" or "unchecked" state.
     """
-    tile_size = compute_tile_size(MODEL_CONFIG["checkboxes"], image.size)
-    detections: List[Detection] = detect_objects_using_tiling(
-        image,
-        CHECKBOXES_MODEL,
-        tile_size,
-        tile_size,
-        MODEL_CONFIG["checkboxes"]["horz_overlap_proportion"],
-        MODEL_CONFIG["checkboxes"]["vert_overlap_proportion"],
-        nms_threshold=0.8,
+    detections: List[Detection] = run_model_with_config(
+        image, "checkboxes", nms_threshold=0.8
     )
     preop_postop_checkboxes = extract_checkboxes(
         detections,
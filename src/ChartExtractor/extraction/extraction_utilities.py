@@ -1,11 +1,11 @@
 """Utilities for detecting and associating meaning to handwritten digits."""
 
 # Built-in imports
-from functools import reduce
+from functools import lru_cache, reduce
 import json
 from pathlib import Path
 from PIL import Image
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 # External imports
 import numpy as np
@@ -13,14 +13,15 @@ import numpy as np
 # Internal imports
 from ..object_detection_models.object_detection_model import ObjectDetectionModel
 from ..utilities.annotations import BoundingBox, Keypoint
-from ..utilities.detections import Detection
+from ..utilities.detections import Detection, DetectionBatch
 from ..utilities.detection_reassembly import (
     intersection_over_minimum,
     non_maximum_suppression,
+    untile_detection_batches,
     untile_detections,
 )
 from ..utilities.image_conversion import pil_to_cv2
-from ..utilities.tiling import tile_image
+from ..utilities.tiling import correct_annotation_coords, tile_image_array
 
 
 MAX_BOX_WIDTH, MAX_BOX_HEIGHT = (0.0174507, 0.0236938)
@@ -112,8 +113,8 @@ def detect_objects_using_tiling(
 ) -> List[Detection]:
     """Detects objects, especially small ones, using image tiling.
 
-    Splits an image up into smaller tiles, runs the model on each tile, then untiles the detections
-    and performs non-maximum suppression on the result.
+    Splits an image up into smaller tiles, runs the model on all of the tiles at once, then untiles
+    the detections and performs non-maximum suppression on the result.
 
     Args:
         `image` (Image.Image):
@@ -152,16 +153,74 @@ def detect_objects_using_tiling(
         A list of detections showing objects on the image that the object detection model was
         trained to identify.
     """
-    image_tiles: List[List[Image.Image]] = tile_image(
-        image,
+    image_tiles: List[List[np.ndarray]] = tile_image_array(
+        pil_to_cv2(image),
         slice_width,
         slice_height,
         horizontal_overlap_ratio,
         vertical_overlap_ratio,
     )
+    # All tiles go to the model in one call so that it can batch them into as few
+    # inference runs as it supports, then the results are regrouped into rows.
+    tile_detections: List[List[Detection]] = detection_model(
+        [tile for row in image_tiles for tile in row],
+        confidence=minimum_confidence,
+    )
+    return reassemble_tile_detections(
+        tile_detections,
+        [len(row) for row in image_tiles],
+        slice_width,
+        slice_height,
+        horizontal_overlap_ratio,
+        vertical_overlap_ratio,
+        nms_threshold,
+        overlap_comparator,
+        sorting_fn,
+    )
+
+
+def reassemble_tile_detections(
+    tile_detections: List[List[Detection]],
+    row_lengths: List[int],
+    slice_width: int,
+    slice_height: int,
+    horizontal_overlap_ratio: float,
+    vertical_overlap_ratio: float,
+    nms_threshold: float = 0.5,
+    overlap_comparator: Callable[[Detection, Detection], float] = intersection_over_minimum,
+    sorting_fn: Callable[[Detection], float] = lambda det: det.annotation.area * det.confidence,
+) -> List[Detection]:
+    """Moves the detections made on each tile back onto the full image and removes duplicates.
+
+    Args:
+        `tile_detections` (List[List[Detection]]):
+            The detections for each tile, in row-major order.
+        `row_lengths` (List[int]):
+            The number of tiles in each row.
+        `slice_width` (int):
+            The width of each slice.
+        `slice_height` (int):
+            The height of each slice.
+        `horizontal_overlap_ratio` (float):
+            The amount of left-right overlap between slices.
+        `vertical_overlap_ratio` (float):
+            The amount of top-bottom overlap between slices.
+        `nms_threshold` (float):
+            The threshold above which nms registers a 'match'. Defaults to 0.5.
+        `overlap_comparator` (float):
+            The function that determines how much two detections overlap. Defaults to the
+            intersection of the detections divided by the minimum of the two detection's areas.
+        `sorting_fn` (Callable[[Detection], float]):
+            The function that applies a 'score' to each detection to determine which has priority
+            when NMS deletes detections. Defaults to the detection's confidence times its area.
+
+    Returns:
+        The detections on the full image after non-maximum suppression.
+    """
+    row_starts: List[int] = np.cumsum([0] + row_lengths).tolist()
     detections: List[List[List[Detection]]] = [
-        [detection_model(pil_to_cv2(tile), confidence=minimum_confidence)[0] for tile in row]
-        for row in image_tiles
+        tile_detections[row_start : row_start + row_length]
+        for row_start, row_length in zip(row_starts, row_lengths)
     ]
     detections: List[Detection] = untile_detections(
         detections,
@@ -179,6 +238,188 @@ def detect_objects_using_tiling(
     return detections
 
 
+def reassemble_tile_detection_batches(
+    tile_detections: List[DetectionBatch],
+    row_lengths: List[int],
+    slice_width: int,
+    slice_height: int,
+    horizontal_overlap_ratio: float,
+    vertical_overlap_ratio: float,
+    nms_threshold: float = 0.5,
+    overlap_comparator: Callable[[Detection, Detection], float] = intersection_over_minimum,
+    sorting_fn: Callable[[Detection], float] = lambda det: det.annotation.area * det.confidence,
+) -> List[Detection]:
+    """Moves batched tile detections back onto the full image and removes duplicates.
+
+    Matches reassemble_tile_detections, but shifts every tile's detections at once and only
+    builds Detection objects for the full image.
+
+    Args:
+        `tile_detections` (List[DetectionBatch]):
+            The detections for each tile, in row-major order.
+        `row_lengths` (List[int]):
+            The number of tiles in each row.
+        `slice_width` (int):
+            The width of each slice.
+        `slice_height` (int):
+            The height of each slice.
+        `horizontal_overlap_ratio` (float):
+            The amount of left-right overlap between slices.
+        `vertical_overlap_ratio` (float):
+            The amount of top-bottom overlap between slices.
+        `nms_threshold` (float):
+            The threshold above which nms registers a 'match'. Defaults to 0.5.
+        `overlap_comparator` (float):
+            The function that determines how much two detections overlap. Defaults to the
+            intersection of the detections divided by the minimum of the two detection's areas.
+        `sorting_fn` (Callable[[Detection], float]):
+            The function that applies a 'score' to each detection to determine which has priority
+            when NMS deletes detections. Defaults to the detection's confidence times its area.
+
+    Returns:
+        The detections on the full image after non-maximum suppression.
+    """
+    row_starts: List[int] = np.cumsum([0] + row_lengths).tolist()
+    detections: DetectionBatch = untile_detection_batches(
+        [
+            tile_detections[row_start : row_start + row_length]
+            for row_start, row_length in zip(row_starts, row_lengths)
+        ],
+        slice_width,
+        slice_height,
+        horizontal_overlap_ratio,
+        vertical_overlap_ratio,
+    )
+    return non_maximum_suppression(
+        detections=detections.to_detections(),
+        threshold=nms_threshold,
+        overlap_comparator=overlap_comparator,
+        sorting_fn=sorting_fn,
+    )
+
+
+def find_search_regions(
+    expected_boxes: List[BoundingBox],
+    padding: float,
+    min_size: int,
+    image_width: int,
+    image_height: int,
+) -> List[Tuple[int, int, int, int]]:
+    """Finds the parts of an image that need to be searched to find a set of expected boxes.
+
+    Each box is padded, grown to at least min_size on each side, and clipped to the image.
+    Overlapping regions are then merged until none overlap, so that nothing is searched twice.
+
+    Args:
+        `expected_boxes` (List[BoundingBox]):
+            The boxes, in image coordinates, where the objects are expected to be.
+        `padding` (float):
+            The number of pixels to add on every side of each box to allow for error.
+        `min_size` (int):
+            The smallest width and height a region can have. Should be at least the tile size
+            so that the regions can be tiled.
+        `image_width` (int):
+            The width of the image.
+        `image_height` (int):
+            The height of the image.
+
+    Returns:
+        A list of non-overlapping (left, top, right, bottom) regions.
+    """
+
+    def expand(low: float, high: float, limit: int) -> Tuple[int, int]:
+        low, high = max(0, low - padding), min(limit, high + padding)
+        size: int = min(limit, max(min_size, int(high - low) + 1))
+        start: int = int(min(max(0, (low + high - size) / 2), limit - size))
+        return start, start + size
+
+    regions: List[Tuple[int, int, int, int]] = list()
+    for box in expected_boxes:
+        left, right = expand(box.left, box.right, image_width)
+        top, bottom = expand(box.top, box.bottom, image_height)
+        regions.append((left, top, right, bottom))
+
+    merged_any: bool = True
+    while merged_any:
+        merged_any = False
+        merged: List[Tuple[int, int, int, int]] = list()
+        for region in regions:
+            for ix, other in enumerate(merged):
+                if (
+                    region[0] < other[2]
+                    and other[0] < region[2]
+                    and region[1] < other[3]
+                    and other[1] < region[3]
+                ):
+                    merged[ix] = (
+                        min(region[0], other[0]),
+                        min(region[1], other[1]),
+                        max(region[2], other[2]),
+                        max(region[3], other[3]),
+                    )
+                    merged_any = True
+                    break
+            else:
+                merged.append(region)
+        regions = merged
+    return sorted(regions)
+
+
+def detect_objects_in_regions(
+    image: Image.Image,
+    detection_model: ObjectDetectionModel,
+    regions: List[Tuple[int, int, int, int]],
+    slice_width: int,
+    slice_height: int,
+    horizontal_overlap_ratio: float,
+    vertical_overlap_ratio: float,
+    **kwargs,
+) -> List[Detection]:
+    """Detects objects using tiling, but only inside the given regions of the image.
+
+    Args:
+        `image` (Image.Image):
+            The image to detect on.
+        `detection_model` (ObjectDetectionModel):
+            The detection model to use.
+        `regions` (List[Tuple[int, int, int, int]]):
+            The non-overlapping (left, top, right, bottom) regions to search. Each must be at
+            least as large as a slice.
+        `slice_width` (int):
+            The width of each slice.
+        `slice_height` (int):
+            The height of each slice.
+        `horizontal_overlap_ratio` (float):
+            The amount of left-right overlap between slices.
+        `vertical_overlap_ratio` (float):
+            The amount of top-bottom overlap between slices.
+        `**kwargs`:
+            Extra keyword arguments passed on to detect_objects_using_tiling.
+
+    Returns:
+        The detections from every region, in the full image's coordinates.
+    """
+    detections: List[Detection] = list()
+    for left, top, right, bottom in regions:
+        region_detections: List[Detection] = detect_objects_using_tiling(
+            image.crop((left, top, right, bottom)),
+            detection_model,
+            slice_width,
+            slice_height,
+            horizontal_overlap_ratio,
+            vertical_overlap_ratio,
+            **kwargs,
+        )
+        detections.extend(
+            Detection(
+                correct_annotation_coords(det.annotation, left, top, "tile_to_image"),
+                det.confidence,
+            )
+            for det in region_detections
+        )
+    return detections
+
+
 def get_detection_by_name(
     detections: List[Detection], name: str
 ) -> Optional[Detection]:
@@ -201,6 +442,32 @@ def get_detection_by_name(
         return None
 
 
+def get_landmark_centers(
+    landmarks: List[BoundingBox], landmark_names: List[str]
+) -> List[Tuple[float, float]]:
+    """Gets the centers of the named landmarks, ordered by landmark name.
+
+    Reads each landmark once, keeping the first box found for each name. Names with no
+    matching box are left out, so the caller sees a short list rather than an error.
+
+    Args:
+        `landmarks` (List[BoundingBox]):
+            The landmark boxes to search.
+        `landmark_names` (List[str]):
+            The categories of the landmarks to keep.
+
+    Returns:
+        The centers of the landmarks whose category is in landmark_names, sorted by category.
+    """
+    wanted_names: Set[str] = set(landmark_names)
+    centers: Dict[str, Tuple[float, float]] = dict()
+    for landmark in landmarks:
+        if landmark.category in wanted_names and landmark.category not in centers:
+            centers[landmark.category] = landmark.center
+    return [centers[name] for name in sorted(centers)]
+
+
+@lru_cache(maxsize=None)
 def label_studio_to_bboxes(
     path_to_json_data: Path,
     desired_im_width: int = 3300,
@@ -208,6 +475,9 @@ def label_studio_to_bboxes(
 ) -> List[BoundingBox]:
     """
     Convert the json data from label studio to a list of BoundingBox objects
+
+    The result is cached per path, so callers must not modify the returned boxes.
+
     Args:
         path_to_json_data (Path):
             Path to the json data from label studio
@@ -68,6 +68,10 @@ def extract_physiological_indicators(
         )
     )
 
+    physio_landmarks: List[BoundingBox] = get_physio_landmarks(
+        document_detections, im_width
+    )
+
     physiological_indicators: Dict[str, Dict[str, List[int]]] = {
         name: dict() for name in PHYSIO_LANDMARK_NAMES
     }
@@ -77,16 +81,16 @@ def extract_physiological_indicators(
         boxes_in_range: List[BoundingBox] = list(
             filter(lambda bb: left < bb.center[0] < right, physiological_digit_boxes)
         )
+        # Each box's indicator is found once, rather than once per indicator name.
+        box_indicators: List[str] = [
+            find_closest_landmark(bb, physio_landmarks) for bb in boxes_in_range
+        ]
         for indicator_name in PHYSIO_LANDMARK_NAMES:
-            number: List[BoundingBox] = list(
-                filter(
-                    lambda bb: find_indicator_for_bbox(
-                        bb, document_detections, im_width
-                    )
-                    == indicator_name,
-                    boxes_in_range,
-                )
-            )
+            number: List[BoundingBox] = [
+                bb
+                for bb, indicator in zip(boxes_in_range, box_indicators)
+                if indicator == indicator_name
+            ]
             number: List[BoundingBox] = sorted(number, key=lambda bb: bb.center[0])
             number: str = "".join([bb.category for bb in number])
             if number != "":
@@ -116,20 +120,45 @@ def find_indicator_for_bbox(
     Returns:
         A string showing which physiological indicator the box belongs to.
     """
-    physio_landmarks: List[Detection] = list(
-        filter(
-            lambda det: all(
-                [
-                    (det.annotation.category in PHYSIO_LANDMARK_NAMES),
-                    (det.annotation.center[0] < 0.5 * im_width),
-                ]
-            ),
-            document_detections,
-        )
-    )
-    physio_landmarks: List[BoundingBox] = [det.annotation for det in physio_landmarks]
+    return find_closest_landmark(bbox, get_physio_landmarks(document_detections, im_width))
+
+
+def get_physio_landmarks(
+    document_detections: List[Detection], im_width: int = 1
+) -> List[BoundingBox]:
+    """Gets the physiological indicator landmarks on the left half of the image.
+
+    Args:
+        `document_detections` (List[Detection]):
+            All of the document landmark detections.
+        `im_width` (int):
+            The width of the image.
+
+    Returns:
+        The bounding boxes of the physiological indicator landmarks.
+    """
+    return [
+        det.annotation
+        for det in document_detections
+        if det.annotation.category in PHYSIO_LANDMARK_NAMES
+        and det.annotation.center[0] < 0.5 * im_width
+    ]
+
+
+def find_closest_landmark(bbox: BoundingBox, landmarks: List[BoundingBox]) -> str:
+    """Finds the category of the landmark that is vertically closest to the bounding box.
+
+    Args:
+        `bbox` (BoundingBox):
+            The bounding box in question.
+        `landmarks` (List[BoundingBox]):
+            The landmarks to choose between.
+
+    Returns:
+        The category of the closest landmark.
+    """
     distances: Dict[str, float] = {
-        pl.category: abs(pl.center[1] - bbox.center[1]) for pl in physio_landmarks
+        pl.category: abs(pl.center[1] - bbox.center[1]) for pl in landmarks
     }
     return min(distances, key=distances.get)
 
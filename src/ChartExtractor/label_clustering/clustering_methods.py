@@ -230,7 +230,7 @@ def __time_correction(clusters: List[Cluster]) -> List[Cluster]:
 
 def cluster_boxes(
     bounding_boxes: List[BoundingBox],
-    method: Callable[[List[BoundingBox]], List[Cluster]],
+    method: Callable[..., List[int]],
     unit: Literal["mins", "mmhg"],
     **kwargs,
 ) -> List[Cluster]:
@@ -240,10 +240,11 @@ def cluster_boxes(
     Args:
         `bounding_boxes` (List[BoundingBox]):
             List of BoundingBox objects to cluster based on location.
-        `method` (Callable[[List[BoundingBox]], List[Cluster]]):
-            The function to use for clustering. The key word arguments for this function need to
-            be supplied as extra kwargs to this function. Alternatively, no kwargs can be passed
-            if a partially applied function is passed.
+        `method` (Callable[..., List[int]]):
+            The function to use for clustering, which returns a cluster label for each box. The
+            key word arguments for this function need to be supplied as extra kwargs to this
+            function. Alternatively, no kwargs can be passed if a partially applied function is
+            passed.
         `unit`:
             The unit of the bounding boxes. Can be "mins" or "mmhg".
 
@@ -254,13 +255,13 @@ def cluster_boxes(
     if unit not in ["mins", "mmhg"]:
         raise ValueError(f"Invalid unit: {unit}")
 
-    labels = method(bounding_boxes=bounding_boxes, **kwargs)
+    labels = np.asarray(method(bounding_boxes=bounding_boxes, **kwargs))
 
     # Return a list Cluster objects based on the clustering results
     clusters = []
-    for label in set(labels):
+    for label in set(labels.tolist()):
         cluster_bounding_boxes = [
-            bounding_boxes[i] for i in range(len(labels)) if labels[i] == label
+            bounding_boxes[i] for i in np.flatnonzero(labels == label)
         ]
         clusters.append(Cluster.from_boxes_and_unit(cluster_bounding_boxes, unit))
 
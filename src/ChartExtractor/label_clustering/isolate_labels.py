@@ -6,7 +6,7 @@ It includes a public function for external use and several worker functions that
 
 # Built-in imports
 from operator import attrgetter
-from typing import List, Tuple
+from typing import FrozenSet, List, Tuple
 
 # External imports
 import numpy as np
@@ -16,6 +16,9 @@ from scipy.stats import gaussian_kde
 from ..utilities.annotations import BoundingBox
 
 
+DIGIT_CATEGORIES: FrozenSet[str] = frozenset(str(i) for i in range(10))
+
+
 def __find_density_max(values: List[int], search_area: int) -> int:
     """Given a list of values and a search area, find the index of where the highest density is.
 
@@ -102,17 +105,12 @@ def isolate_blood_pressure_legend_bounding_boxes(
     """
     # filter out bounding boxes whose category is not a digit, and which are certainly not
     # in the region of interest.
-    bboxes: List[BoundingBox] = list(
-        filter(
-            lambda bb: all(
-                [
-                    bb.category in [str(i) for i in range(10)],
-                    0.2 * im_height < bb.center[1] < 0.8 * im_height,
-                ]
-            ),
-            document_landmark_boxes,
-        )
-    )
+    bboxes: List[BoundingBox] = [
+        bb
+        for bb in document_landmark_boxes
+        if bb.category in DIGIT_CATEGORIES
+        and 0.2 * im_height < bb.center[1] < 0.8 * im_height
+    ]
 
     # x_loc and y_loc form the point at the top left corner of the bp and hr section.
     x_loc: int = __find_density_max([bb.left for bb in bboxes], im_width)
@@ -11,10 +11,13 @@ This approach promotes modularity, flexibility, and future-proofing of the progr
 
 # Built-in Imports
 from pathlib import Path
-from typing import List, Protocol
+from typing import List, Protocol, Tuple, runtime_checkable
 
 # Internal Imports
-from ..utilities.detections import Detection
+from ..utilities.detections import Detection, DetectionBatch
+
+# External Imports
+import numpy as np
 
 
 class ObjectDetectionModel(Protocol):
@@ -34,3 +37,51 @@ class ObjectDetectionModel(Protocol):
             A list of Detection objects.
         """
         pass
+
+
+@runtime_checkable
+class BatchedObjectDetectionModel(ObjectDetectionModel, Protocol):
+    """An object detection model that preprocesses and detects in separate steps.
+
+    Models with the same input size can share the output of preprocess_images, so
+    callers that run several of them on the same images only preprocess each image once.
+    """
+
+    batch_size: int
+
+    def preprocess_images(self, images: List[np.ndarray]) -> np.ndarray:
+        """Preprocesses images into a single input tensor.
+
+        Args:
+            images (List[np.ndarray]):
+                Images read by cv2.imread.
+
+        Returns (np.ndarray):
+            The preprocessed images.
+        """
+        pass
+
+    def detect_preprocessed_batches(
+        self,
+        batch: np.ndarray,
+        original_image_shapes: List[Tuple[int, ...]],
+        confidence: float = 0.5,
+        iou_threshold: float = 0.1,
+    ) -> List[DetectionBatch]:
+        """Detects objects on images that have already been through preprocess_images.
+
+        Args:
+            batch (np.ndarray):
+                The output of preprocess_images.
+            original_image_shapes (List[Tuple[int, ...]]):
+                The shape of each image before preprocessing.
+            confidence (float):
+                The level of confidence below which all detections are culled.
+            iou_threshold (float):
+                The intersection over union threshold under which to remove
+                detections via non-maximum suppression.
+
+        Returns (List[DetectionBatch]):
+            The detections on each image.
+        """
+        pass
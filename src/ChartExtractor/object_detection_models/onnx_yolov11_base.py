@@ -0,0 +1,390 @@
+"""This module implements the `OnnxYolov11Base` class shared by the yolov11 onnx wrappers.
+
+The `OnnxYolov11Base` class loads a YOLOv11 model into an onnx runtime session and runs it on
+batches of images. The wrappers for each kind of model inherit from it and only convert the
+model's raw output into detections.
+
+Key functionalities include:
+    - Provides a common interface for detections (via the __call__ method).
+    - Loading the YOLOv11 model from a weights file path.
+    - Preprocessing images into batches that can be shared between models.
+    - Running the session in batches, through a persistent device buffer on the GPU.
+"""
+
+# Built-in imports
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, Union
+
+# External imports
+import cv2
+import numpy as np
+import onnxruntime as ort
+
+# Internal imports
+from ..object_detection_models.object_detection_model import BatchedObjectDetectionModel
+from ..utilities.detections import Detection, DetectionBatch
+
+
+class OnnxYolov11Base(BatchedObjectDetectionModel):
+    """Runs a yolov11 ONNX model on batches of images.
+
+    Subclasses implement results_to_detection_batch for their kind of model's output.
+
+    Attributes:
+        model:
+            The underlying onnx runtime model.
+    """
+
+    def __init__(
+        self,
+        model_weights_filepath: Path,
+        model_classes_filepath: Path,
+        input_im_width: int = 640,
+        input_im_height: int = 640,
+        lazy_loading: bool = False,
+        session_options: Optional[ort.SessionOptions] = None,
+        batch_size: int = 16,
+        providers: Optional[List[Union[str, Tuple[str, Dict]]]] = None,
+    ):
+        """Initializes the onnx model.
+
+        Args:
+            model_weights_filepath (Path):
+                The filepath to the model's weights.
+            model_classes_filepath (Path):
+                The filepath to a json file with all the classes.
+            input_im_width (int):
+                The image width that the model accepts.
+                Defaults to 640.
+            input_im_height (int):
+                The image height that the model accepts.
+                Defaults to 640.
+            lazy_loading (bool):
+                Whether or not to load the model only when it is called for detection.
+                Defaults to False.
+            session_options (Optional[ort.SessionOptions]):
+                Options for the onnx runtime session, such as its thread counts.
+                Defaults to None, which uses onnx runtime's defaults.
+            batch_size (int):
+                The maximum number of images to stack into a single run of the session.
+                Defaults to 16.
+            providers (Optional[List[Union[str, Tuple[str, Dict]]]]):
+                The onnx runtime execution providers to use, in order of preference. Each is
+                either a provider's name or a tuple of its name and its provider options.
+                Defaults to None, which uses onnx runtime's defaults.
+        """
+        self.model_weights_filepath = model_weights_filepath
+        self.input_im_width = input_im_width
+        self.input_im_height = input_im_height
+        self.session_options = session_options
+        self.batch_size = batch_size
+        self.providers = providers
+        self.classes = self.load_classes(model_classes_filepath)
+        self.class_names: List[str] = [
+            str(self.classes[str(ix)]) for ix in range(len(self.classes))
+        ]
+        self.model_is_loaded = False
+        self.load_lock = Lock()
+        if not lazy_loading:
+            self.load_model()
+
+    @staticmethod
+    def load_classes(model_metadata_filepath: Path) -> Dict:
+        """Loads the classes from a yaml file into a list.
+
+        Args:
+            model_metadata_filepath (Path):
+                The path to the model metadata.
+
+        Raises:
+            Exception:
+                Any exception relating to loading a file.
+
+        Returns:
+            A dictionary mapping the numerical id of a class to the class' name.
+        """
+        potential_err_msg = "An exception has occured while loading the classes "
+        potential_err_msg += "yaml file. Ensure the model metadata filepath is "
+        potential_err_msg += "correct and the model's yaml file is correctly formatted."
+        try:
+            with open(model_metadata_filepath, "r") as f:
+                classes: Dict[str, str] = json.load(f)
+        except FileNotFoundError as e:
+            print(potential_err_msg)
+            print(e)
+        return classes
+    
+    def load_model(self):
+        """Loads the model."""
+        self.model = ort.InferenceSession(
+            self.model_weights_filepath,
+            sess_options=self.session_options,
+            providers=self.providers,
+        )
+        model_input = self.model.get_inputs()[0]
+        self.input_name = model_input.name
+        self.model_accepts_batches = not isinstance(model_input.shape[0], int)
+        # Models converted to half precision may also expect half precision inputs.
+        self.input_dtype = np.float16 if model_input.type == "tensor(float16)" else np.float32
+        # On a GPU, batches are copied into one persistent device buffer that the session is
+        # bound to, rather than having the session allocate and copy for every run.
+        self.uses_io_binding = "CUDAExecutionProvider" in self.model.get_providers()
+        if self.uses_io_binding:
+            self.io_binding = self.model.io_binding()
+            self.io_binding_lock = Lock()
+            self.device_input = None
+        self.model_is_loaded = True
+
+    def __call__(
+        self,
+        images: List[np.array],
+        confidence: float = 0.5,
+        iou_threshold: float = 0.1,
+    ) -> List[List[Detection]]:
+        """Runs the model on a list of images.
+
+        Args:
+            images (List[np.array]):
+                A list of images read by cv2.imread.
+            confidence (float):
+                The level of confidence below which all detections are culled.
+                Default of 0.5.
+            iou_threshold (float):
+                The intersection over union threshold under which to remove
+                detections via non-maximum suppression.
+
+        Returns:
+            A list of detections for each image.
+        """
+        if not isinstance(images, list):
+            images = [images]
+        # Only batch_size images are preprocessed at a time, so the model's input never
+        # holds more than one batch.
+        return [
+            image_detections
+            for start in range(0, len(images), self.batch_size)
+            for image_detections in self.detect_preprocessed(
+                self.preprocess_images(images[start : start + self.batch_size]),
+                [im.shape for im in images[start : start + self.batch_size]],
+                confidence,
+                iou_threshold,
+            )
+        ]
+
+    def detect(
+        self,
+        image: np.array,
+        confidence: float,
+        iou_threshold: float,
+    ) -> List[Detection]:
+        """Runs the model on a single image.
+
+        Args:
+            image (np.array):
+                The image to detect on.
+            confidence (float):
+                The level of confidence below which all detections are culled.
+                Default of 0.5.
+            iou_threshold (float):
+                The intersection over union threshold under which to remove
+                detections via non-maximum suppression.
+
+        Returns:
+            A list of detections on the image.
+        """
+        return self.detect_preprocessed(
+            self.preprocess_images([image]), [image.shape], confidence, iou_threshold
+        )[0]
+
+    def preprocess_images(self, images: List[np.array]) -> np.array:
+        """Preprocesses a list of images into a single (N, 3, H, W) input tensor.
+
+        The tensor only depends on the model's input size, so it can be computed once and
+        passed to detect_preprocessed for every model that shares that size. Callers give it
+        at most batch_size images at a time to bound its size.
+
+        Args:
+            images (List[np.array]):
+                Images read by cv2.imread.
+
+        Returns:
+            A contiguous float32 array holding every preprocessed image.
+        """
+        batch: np.array = np.empty(
+            (len(images), 3, self.input_im_height, self.input_im_width),
+            dtype=np.float32,
+        )
+        for ix, image in enumerate(images):
+            image: np.array = cv2.resize(
+                image,
+                (self.input_im_width, self.input_im_height),
+                interpolation=cv2.INTER_LINEAR,
+            )
+            # Reversing the channels and dividing straight into the batch converts BGR to RGB,
+            # scales to float32, and moves the channels first in a single pass.
+            np.divide(
+                image[:, :, ::-1].transpose((2, 0, 1)), np.float32(255.0), out=batch[ix]
+            )
+        return batch
+
+    def detect_preprocessed(
+        self,
+        batch: np.array,
+        original_image_shapes: List[Tuple[int, ...]],
+        confidence: float = 0.5,
+        iou_threshold: float = 0.1,
+    ) -> List[List[Detection]]:
+        """Runs the model on images that have already been through preprocess_images.
+
+        Args:
+            batch (np.array):
+                The output of preprocess_images.
+            original_image_shapes (List[Tuple[int, ...]]):
+                The shape of each image before preprocessing.
+            confidence (float):
+                The level of confidence below which all detections are culled.
+                Default of 0.5.
+            iou_threshold (float):
+                The intersection over union threshold under which to remove
+                detections via non-maximum suppression. Default of 0.1.
+
+        Returns:
+            A list of detections for each image.
+        """
+        return [
+            detection_batch.to_detections()
+            for detection_batch in self.detect_preprocessed_batches(
+                batch, original_image_shapes, confidence, iou_threshold
+            )
+        ]
+
+    def detect_preprocessed_batches(
+        self,
+        batch: np.array,
+        original_image_shapes: List[Tuple[int, ...]],
+        confidence: float = 0.5,
+        iou_threshold: float = 0.1,
+    ) -> List[DetectionBatch]:
+        """Runs the model on images that have already been through preprocess_images.
+
+        The session is run once per batch_size images. Models exported with a fixed batch
+        size are instead run on each image in turn.
+
+        Args:
+            batch (np.array):
+                The output of preprocess_images.
+            original_image_shapes (List[Tuple[int, ...]]):
+                The shape of each image before preprocessing.
+            confidence (float):
+                The level of confidence below which all detections are culled.
+                Default of 0.5.
+            iou_threshold (float):
+                The intersection over union threshold under which to remove
+                detections via non-maximum suppression. Default of 0.1.
+
+        Returns:
+            The detections on each image as a DetectionBatch.
+        """
+        if not self.model_is_loaded:
+            # Two threads can share a model, so only the first of them loads it.
+            with self.load_lock:
+                if not self.model_is_loaded:
+                    self.load_model()
+        step: int = self.batch_size if self.model_accepts_batches else 1
+        pred_results: List[np.array] = []
+        for start in range(0, len(batch), step):
+            inputs = batch[start : start + step].astype(self.input_dtype, copy=False)
+            if self.uses_io_binding:
+                outputs = self.run_with_io_binding(inputs)
+            else:
+                outputs = self.model.run(None, {self.input_name: inputs})[0]
+            pred_results.append(outputs.astype(np.float32, copy=False))
+        return [
+            self.results_to_detection_batch(
+                image_results, image_shape, confidence, iou_threshold
+            )
+            for image_results, image_shape in zip(
+                (r for results in pred_results for r in results), original_image_shapes
+            )
+        ]
+
+    def run_with_io_binding(self, inputs: np.array, device: str = "cuda") -> np.array:
+        """Runs the session on a batch through its persistent device input buffer.
+
+        The buffer is only reallocated, and the output rebound to match, when the batch shape
+        changes, which happens at most once per call for the final, shorter batch. Otherwise
+        the batch is written into the buffer in place.
+
+        Args:
+            inputs (np.array):
+                The preprocessed batch to run the model on.
+            device (str):
+                The onnx runtime device name that the buffer lives on. Defaults to "cuda".
+
+        Returns:
+            The model's first output, copied back to the host.
+        """
+        with self.io_binding_lock:
+            if self.device_input is None or self.device_input.shape() != list(inputs.shape):
+                self.device_input = ort.OrtValue.ortvalue_from_numpy(inputs, device, 0)
+                self.io_binding.bind_ortvalue_input(self.input_name, self.device_input)
+                self.io_binding.clear_binding_outputs()
+                self.io_binding.bind_output(self.model.get_outputs()[0].name, device)
+            else:
+                self.device_input.update_inplace(inputs)
+            self.model.run_with_iobinding(self.io_binding)
+            return self.io_binding.copy_outputs_to_cpu()[0]
+
+    def results_to_detections(
+        self,
+        image_results: np.array,
+        original_image_shape: Tuple[int, ...],
+        confidence: float,
+        iou_threshold: float,
+    ) -> List[Detection]:
+        """Converts the model's raw output for one image into Detection objects.
+
+        Args:
+            image_results (np.array):
+                The model's output for a single image.
+            original_image_shape (Tuple[int, ...]):
+                The shape of the image before preprocessing.
+            confidence (float):
+                The level of confidence below which all detections are culled.
+            iou_threshold (float):
+                The intersection over union threshold under which to remove
+                detections via non-maximum suppression.
+
+        Returns:
+            A list of detections on the image.
+        """
+        return self.results_to_detection_batch(
+            image_results, original_image_shape, confidence, iou_threshold
+        ).to_detections()
+
+    def results_to_detection_batch(
+        self,
+        image_results: np.array,
+        original_image_shape: Tuple[int, ...],
+        confidence: float,
+        iou_threshold: float,
+    ) -> DetectionBatch:
+        """Converts the model's raw output for one image into a DetectionBatch.
+
+        Args:
+            image_results (np.array):
+                The model's output for a single image.
+            original_image_shape (Tuple[int, ...]):
+                The shape of the image before preprocessing.
+            confidence (float):
+                The level of confidence below which all detections are culled.
+            iou_threshold (float):
+                The intersection over union threshold under which to remove
+                detections via non-maximum suppression.
+
+        Returns:
+            The detections on the image as parallel arrays.
+        """
+        raise NotImplementedError
@@ -19,175 +19,66 @@ modularity and reusability.
 """
 
 # Built-in imports
-import json
-from pathlib import Path
 from typing import Dict, List, Literal, Tuple
 
 # External imports
 import cv2
 import numpy as np
-import onnxruntime as ort
 
 # Internal imports
-from ..object_detection_models.object_detection_model import ObjectDetectionModel
+from ..object_detection_models.onnx_yolov11_base import OnnxYolov11Base
 from ..utilities.annotations import BoundingBox, Keypoint, Point
-from ..utilities.detections import Detection
+from ..utilities.detections import Detection, DetectionBatch
 from ..utilities.detection_reassembly import non_maximum_suppression
 
 
-class OnnxYolov11PoseSingle(ObjectDetectionModel):
+class OnnxYolov11PoseSingle(OnnxYolov11Base):
     """Provides a wrapper for a yolov11 pose ONNX model.
 
-    This class inherits from the `ObjectDetectionModel` interface, enabling us to use the onnx
-    model within our program through a consistent interface.
+    This class inherits from `OnnxYolov11Base`, which loads and runs the onnx model, and
+    implements the `ObjectDetectionModel` interface so the model can be used within our program
+    through a consistent interface.
 
     Attributes:
         model:
             The underlying onnx runtime model.
     """
 
-    def __init__(
+    def results_to_detection_batch(
         self,
-        model_weights_filepath: Path,
-        model_classes_filepath: Path,
-        input_im_width: int = 640,
-        input_im_height: int = 640,
-        lazy_loading: bool = False
-    ):
-        """Initializes the onnx model.
-
-        Args:
-            model_weights_filepath (Path):
-                The filepath to the model's weights.
-            model_classes_filepath (Path):
-                The filepath to a json file with all the classes.
-            input_im_width (int):
-                The image width that the model accepts.
-                Defaults to 640.
-            input_im_height (int):
-                The image height that the model accepts.
-                Defaults to 640.
-            lazy_loading (bool):
-                Whether or not to load the model only when it is called for detection.
-                Defaults to False.
-        """
-        self.model_weights_filepath = model_weights_filepath
-        self.input_im_width = input_im_width
-        self.input_im_height = input_im_height
-        self.classes = self.load_classes(model_classes_filepath)
-        self.model_is_loaded = False
-        if not lazy_loading:
-            self.load_model()
-
-
-    @staticmethod
-    def load_classes(model_metadata_filepath: Path) -> Dict:
-        """Loads the classes from a yaml file into a list.
-
-        Args:
-            model_metadata_filepath (Path):
-                The path to the model metadata.
-
-        Raises:
-            Exception:
-                Any exception relating to loading a file.
-
-        Returns:
-            A dictionary mapping the numerical id of a class to the class' name.
-        """
-        potential_err_msg = "An exception has occured while loading the classes "
-        potential_err_msg += "yaml file. Ensure the model metadata filepath is "
-        potential_err_msg += "correct and the model's yaml file is correctly formatted."
-        try:
-            classes: Dict[str, str] = json.loads(
-                open(model_metadata_filepath, "r").read()
-            )
-        except FileNotFoundError as e:
-            print(potential_err_msg)
-            print(e)
-        return classes
-    
-    def load_model(self):
-        """Loads the model."""
-        self.model = ort.InferenceSession(self.model_weights_filepath)
-        self.model_is_loaded = True
-
-    def __call__(
-        self,
-        images: List[np.array],
-        confidence: float = 0.5,
-        iou_threshold: float = 0.1,
-    ) -> List[List[Detection]]:
-        """Runs the model on a list of images.
-
-        Args:
-            images (List[np.array]):
-                A list of images read by cv2.imread.
-            confidence (float):
-                The level of confidence below which all detections are culled.
-                Default of 0.5.
-            iou_threshold (float):
-                The intersection over union threshold under which to remove
-                detections via non-maximum suppression.
-
-        Returns:
-            A list of detections for each image.
-        """
-        if not model_is_loaded:
-            self.load_model()
-        if not isinstance(images, list):
-            images = [images]
-        detections: List[List[Detection]] = [
-            self.detect(im, confidence, iou_threshold) for im in images
-        ]
-        return detections
-
-    def detect(
-        self,
-        image: np.array,
+        image_results: np.array,
+        original_image_shape: Tuple[int, ...],
         confidence: float,
         iou_threshold: float,
-    ) -> List[Detection]:
-        """Runs the model on a single image.
+    ) -> DetectionBatch:
+        """Converts the model's raw output for one image into a DetectionBatch.
 
         Args:
-            image (np.array):
-                The image to detect on.
+            image_results (np.array):
+                The model's output for a single image.
+            original_image_shape (Tuple[int, ...]):
+                The shape of the image before preprocessing.
             confidence (float):
                 The level of confidence below which all detections are culled.
-                Default of 0.5.
             iou_threshold (float):
                 The intersection over union threshold under which to remove
                 detections via non-maximum suppression.
 
         Returns:
-            A list of detections on the image.
+            The detections on the image as parallel arrays.
         """
-        original_im_width, original_im_height = image.shape[:2]
-        image: np.array = self.preprocess_image(image)
-        image: np.array = image.transpose((2, 0, 1))
-        image: np.array = np.expand_dims(image, axis=0)
-        pred_results = self.model.run(None, {"images": image})
-        detections = self.postprocess_results(pred_results, confidence, iou_threshold)
+        original_im_height, original_im_width = original_image_shape[:2]
+        detections = self.postprocess_results(image_results, confidence, iou_threshold)
         detections = self.scale_detections_back_to_input_size(
             detections, original_im_width, original_im_height
         )
-        return [
-            Detection(
-                Keypoint(
-                    Point(d[4].item(), d[5].item()),
-                    BoundingBox(
-                        str(self.classes[str(int(d[7].item()))]),
-                        d[0].item(),
-                        d[1].item(),
-                        d[2].item(),
-                        d[3].item(),
-                    ),
-                ),
-                d[6].item(),
-            )
-            for d in detections
-        ]
+        return DetectionBatch(
+            xyxy=detections[:, :4],
+            confidence=detections[:, 6],
+            category=detections[:, 7].astype(np.int64),
+            names=self.class_names,
+            keypoints=detections[:, 4:6],
+        )
 
     def preprocess_image(
         self,
@@ -234,7 +125,7 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
 
         Args:
             pred_results:
-                The raw predictions from the onnx model.
+                The raw predictions from the onnx model for a single image.
             confidence (float):
                 The level of confidence below which all detections are culled.
                 Default of 0.5.
@@ -245,8 +136,6 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
         Returns:
             A list of Detection objects.
         """
-        pred_results = pred_results[0][0]
-
         confidences = pred_results[4, :]
         mask = confidences >= confidence_threshold  # Create a mask for cells
 
@@ -255,19 +144,17 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
 
         filtered_output = pred_results[:, mask]  # Apply mask to filter cells
         confidences = confidences[mask]  # filter confidences
-        class_indices = np.argmax(filtered_output[4:5, :], axis=0)  # Get class indices
-
-        x, y, w, h = filtered_output[:4, :]
-        x1 = x - (w / 2)
-        y1 = y - (h / 2)
-        x2 = x + (w / 2)
-        y2 = y + (h / 2)
-        kpx = filtered_output[5, :]
-        kpy = filtered_output[6, :]
-
-        predictions = np.stack(
-            (x1, y1, x2, y2, kpx, kpy, confidences, class_indices), axis=1
-        )
+
+        # The corners are written straight into the output rather than stacked from
+        # separate temporaries.
+        predictions = np.empty((filtered_output.shape[1], 8))
+        half_sizes = filtered_output[2:4, :] / 2
+        np.subtract(filtered_output[0:2, :], half_sizes, out=predictions[:, 0:2].T)
+        np.add(filtered_output[0:2, :], half_sizes, out=predictions[:, 2:4].T)
+        predictions[:, 4:6] = filtered_output[5:7, :].T
+        predictions[:, 6] = confidences
+        # The model has a single class, so every cell's class index is 0.
+        predictions[:, 7] = 0
         predictions = predictions[self.keypoint_not_in_box(predictions)]
         predictions = predictions[self.non_max_suppression(predictions, iou_threshold)]
         return predictions
@@ -331,12 +218,18 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
         these_areas = box_area(these_boxes.T)
         those_areas = box_area(those_boxes.T)
 
-        top_left = np.maximum(these_boxes[:, None, :2], those_boxes[:, :2])
-        bottom_right = np.minimum(these_boxes[:, None, 2:], those_boxes[:, 2:])
-
-        intersection_areas = np.prod(
-            np.clip(bottom_right - top_left, a_min=0, a_max=None), 2
+        # Width and height are kept as separate 2d arrays to avoid an (N, M, 2) intermediate.
+        intersection_widths = np.maximum(
+            np.minimum(these_boxes[:, None, 2], those_boxes[:, 2])
+            - np.maximum(these_boxes[:, None, 0], those_boxes[:, 0]),
+            0,
+        )
+        intersection_heights = np.maximum(
+            np.minimum(these_boxes[:, None, 3], those_boxes[:, 3])
+            - np.maximum(these_boxes[:, None, 1], those_boxes[:, 1]),
+            0,
         )
+        intersection_areas = intersection_widths * intersection_heights
 
         return intersection_areas / (
             these_areas[:, None] + those_areas - intersection_areas
@@ -353,33 +246,47 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
                 The threshold above which to consider two boxes to be overlapping.
 
         Returns:
-            A numpy array of booleans that encode which boxes need to be removed
-            to perform non-maximum suppression. Use as a mask.
+            A numpy array of the indices of the boxes that survive non-maximum suppression,
+            most confident first.
         """
         indexes_of_box: Tuple[int, int] = [0, 3]
         index_of_confidence: int = 6
         index_of_category: int = 7
 
-        rows, _ = predictions.shape
-
-        sort_index = np.flip(predictions[:, index_of_confidence].argsort())
-        predictions = predictions[sort_index]
-
-        boxes = predictions[:, indexes_of_box[0] : indexes_of_box[1] + 1]
+        x1, y1, x2, y2 = predictions[:, indexes_of_box[0] : indexes_of_box[1] + 1].T
+        areas = (x2 - x1) * (y2 - y1)
         categories = predictions[:, index_of_category]
-        ious = self.batch_iou(boxes, boxes)
-        ious = ious - np.eye(rows)
-
-        keep = np.ones(rows, dtype=bool)
-
-        for index, (iou, category) in enumerate(zip(ious, categories)):
-            if not keep[index]:
-                continue
 
-            condition = (iou > iou_threshold) & (categories == category)
-            keep = keep & ~condition
+        if hasattr(cv2.dnn, "NMSBoxesBatched"):
+            # OpenCV 4.7+ runs the same class aware greedy nms in native code.
+            kept_indices = cv2.dnn.NMSBoxesBatched(
+                np.stack((x1, y1, x2 - x1, y2 - y1), axis=1).astype(np.float64),
+                predictions[:, index_of_confidence].astype(np.float32),
+                categories.astype(np.int32),
+                0.0,
+                iou_threshold,
+            )
+            return np.asarray(kept_indices, dtype=np.int64).reshape(-1)
+
+        # Greedily keep the most confident remaining box, then drop the remaining boxes of
+        # its category that overlap it. Only the kept box is compared against the rest, so
+        # the full matrix of ious is never built.
+        order = np.flip(predictions[:, index_of_confidence].argsort())
+        keep: List[int] = []
+        while order.size > 0:
+            best, rest = order[0], order[1:]
+            keep.append(best)
+            intersection_widths = np.clip(
+                np.minimum(x2[best], x2[rest]) - np.maximum(x1[best], x1[rest]), 0, None
+            )
+            intersection_heights = np.clip(
+                np.minimum(y2[best], y2[rest]) - np.maximum(y1[best], y1[rest]), 0, None
+            )
+            intersections = intersection_widths * intersection_heights
+            ious = intersections / (areas[best] + areas[rest] - intersections)
+            order = rest[~((ious > iou_threshold) & (categories[rest] == categories[best]))]
 
-        return keep[sort_index.argsort()]
+        return np.array(keep, dtype=np.int64)
 
     def keypoint_not_in_box(self, predictions: np.ndarray) -> np.ndarray:
         """Generates a mask that can filter keypoints that aren't in the box.
@@ -424,16 +331,13 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
         Returns:
             The detections which have been rescaled to their original image.
         """
-        width_scalar: np.float32 = original_im_width / self.input_im_width
-        height_scalar: np.float32 = original_im_height / self.input_im_height
-        # Rescale bounding box.
-        detections[:, 0] *= width_scalar
-        detections[:, 1] *= height_scalar
-        detections[:, 2] *= width_scalar
-        detections[:, 3] *= height_scalar
-        # Rescale keypoints.
-        detections[:, 4] *= width_scalar
-        detections[:, 5] *= height_scalar
+        width_scalar: float = original_im_width / self.input_im_width
+        height_scalar: float = original_im_height / self.input_im_height
+        # Rescale the bounding box and the keypoint, which are (x, y) pairs in columns 0-5.
+        detections[:, :6] *= np.array(
+            [width_scalar, height_scalar] * 3,
+            dtype=detections.dtype,
+        )
 
         return detections
 
@@ -452,19 +356,22 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
             detections (List[Detections]):
                 The predictions as Detection objects.
             colors (List[Tuple]):
-                The colors to use for the objects.
+                The colors to use for the objects. Defaults to a random color per category.
             mask_alpha (float):
                 The alpha level for the bounding boxes.
 
         Returns:
             An image with detections drawn on top.
         """
+        random_colors: Dict[str, List[float]] = {}
+        random_generator: np.random.Generator = np.random.default_rng(0)
 
         def get_color(category: int) -> Tuple[int, int, int]:
-            if colors is None:
-                return np.random.uniform(0, 255, size=(1, 3)).tolist()[0]
-            else:
+            if colors is not None:
                 return colors[category]
+            if category not in random_colors:
+                random_colors[category] = random_generator.uniform(0, 255, size=3).tolist()
+            return random_colors[category]
 
         det_img = image.copy()
 
@@ -472,35 +379,62 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
         font_size = min([img_height, img_width]) * 0.0006
         text_thickness = int(min([img_height, img_width]) * 0.001)
 
-        mask_img = image.copy()
-
-        # Draw bounding boxes, masks, and text annotations
+        # Captions repeat across detections, so each one is only measured once.
+        text_sizes: Dict[str, Tuple[int, int, int]] = {}
+        drawings: List[Tuple] = []
         for detection in detections:
             category = detection.annotation.category
             box = detection.annotation.box
             score = detection.confidence
-
-            color = get_color(category)
+            caption = f"{category} {int(score * 100)}%"
+            if caption not in text_sizes:
+                (tw, th), baseline = cv2.getTextSize(
+                    text=caption,
+                    fontFace=cv2.FONT_HERSHEY_SIMPLEX,
+                    fontScale=font_size,
+                    thickness=text_thickness,
+                )
+                text_sizes[caption] = (tw, int(th * 1.2), baseline)
             x1, y1, x2, y2 = int(box[0]), int(box[1]), int(box[2]), int(box[3])
+            drawings.append((x1, y1, x2, y2, get_color(category), caption))
+        if not drawings:
+            return det_img
+
+        # Only the area under the boxes and captions changes, so the mask is limited to it
+        # rather than copying and blending the whole image.
+        margin: int = 2 + text_thickness
+        roi_left: int = max(min(d[0] for d in drawings) - margin, 0)
+        roi_top: int = max(
+            min(min(d[1], d[1] - text_sizes[d[5]][1]) for d in drawings) - margin, 0
+        )
+        roi_right: int = min(
+            max(max(d[2], d[0] + text_sizes[d[5]][0]) for d in drawings) + margin,
+            img_width,
+        )
+        roi_bottom: int = min(
+            max(max(d[3], d[1] + text_sizes[d[5]][2]) for d in drawings) + margin,
+            img_height,
+        )
+        if roi_left >= roi_right or roi_top >= roi_bottom:
+            return det_img
+        mask_img = det_img[roi_top:roi_bottom, roi_left:roi_right].copy()
+
+        # Draw bounding boxes, masks, and text annotations
+        for x1, y1, x2, y2, color, caption in drawings:
+            tw, th, _ = text_sizes[caption]
 
             # Draw fill rectangle for mask
-            cv2.rectangle(mask_img, (x1, y1), (x2, y2), color, -1)
+            cv2.rectangle(
+                mask_img,
+                (x1 - roi_left, y1 - roi_top),
+                (x2 - roi_left, y2 - roi_top),
+                color,
+                -1,
+            )
 
             # Draw bounding box
             cv2.rectangle(det_img, (x1, y1), (x2, y2), color, 2)
 
-            # Prepare text (label and score)
-            caption = f"{category} {int(score * 100)}%"
-
-            # Calculate text size and position
-            (tw, th), _ = cv2.getTextSize(
-                text=caption,
-                fontFace=cv2.FONT_HERSHEY_SIMPLEX,
-                fontScale=font_size,
-                thickness=text_thickness,
-            )
-            th = int(th * 1.2)
-
             # Draw filled rectangle for text background
             cv2.rectangle(det_img, (x1, y1), (x1 + tw, y1 - th), color, -1)
 
@@ -517,6 +451,7 @@ class OnnxYolov11PoseSingle(ObjectDetectionModel):
             )
 
         # Blend the mask image with the original image
-        det_img = cv2.addWeighted(mask_img, mask_alpha, det_img, 1 - mask_alpha, 0)
+        det_roi = det_img[roi_top:roi_bottom, roi_left:roi_right]
+        det_roi[:] = cv2.addWeighted(mask_img, mask_alpha, det_roi, 1 - mask_alpha, 0)
 
         return det_img
@@ -12,6 +12,12 @@ Functions:
         destination_points array. A thin wrapper around opencv's findHomography function.
     transform_point(point: Tuple[int, int], homography_matrix: np.ndarray) -> Tuple[int, int]:
         Remaps a single point using the homography matrix.
+    transform_points(points: np.ndarray, homography_matrix: np.ndarray) -> np.ndarray:
+        Remaps an array of points with a single matrix multiply.
+    transform_boxes(boxes: List[BoundingBox], homography_matrix: np.ndarray) -> List[BoundingBox]:
+        Remaps many BoundingBoxes at once.
+    transform_keypoints(keypoints: List[Keypoint], homography_matrix: np.ndarray) -> List[Keypoint]:
+        Remaps many Keypoints at once.
 """
 
 # Built-in imports
@@ -145,3 +151,95 @@ def transform_keypoint(keypoint: Keypoint, homography_matrix: np.ndarray) -> Key
     remapped_point = transform_point(point, homography_matrix)
     remapped_box = transform_box(keypoint.bounding_box, homography_matrix)
     return Keypoint(Point(*remapped_point), remapped_box, do_keypoint_validation=False)
+
+
+def transform_points(points: np.ndarray, homography_matrix: np.ndarray) -> np.ndarray:
+    """Remaps an array of points using the homography matrix.
+
+    Args:
+        points (np.ndarray):
+            A (K, 2) array of points to remap.
+        homography_matrix (np.ndarray):
+            A homography matrix.
+
+    Returns:
+        A (K, 2) array of points which have been transformed by the homography.
+    """
+    homogeneous_points = np.hstack([points, np.ones((len(points), 1))])
+    remapped_points = homogeneous_points @ homography_matrix.T
+    return remapped_points[:, :2] / remapped_points[:, 2:3]
+
+
+def transform_boxes(
+    boxes: List[BoundingBox], homography_matrix: np.ndarray
+) -> List[BoundingBox]:
+    """Remaps a list of BoundingBoxes using the homography matrix.
+
+    Every corner of every box is transformed in one matrix multiply. Short lists use
+    transform_box, since batching only pays off once there are a few boxes.
+
+    Args:
+        boxes (List[BoundingBox]):
+            The bounding boxes to remap.
+        homography_matrix (np.ndarray):
+            A homography matrix.
+
+    Returns:
+        A list of BoundingBoxes that have been transformed by the homography.
+    """
+    if len(boxes) < 4:
+        return [transform_box(box, homography_matrix) for box in boxes]
+    corners = np.array(
+        [
+            [
+                (box.left, box.top),
+                (box.right, box.top),
+                (box.left, box.bottom),
+                (box.right, box.bottom),
+            ]
+            for box in boxes
+        ],
+        dtype=np.float64,
+    )
+    remapped = transform_points(corners.reshape(-1, 2), homography_matrix).reshape(-1, 4, 2)
+    lefts = np.minimum(remapped[:, 0, 0], remapped[:, 2, 0]).tolist()
+    tops = np.minimum(remapped[:, 0, 1], remapped[:, 1, 1]).tolist()
+    rights = np.maximum(remapped[:, 1, 0], remapped[:, 3, 0]).tolist()
+    bottoms = np.maximum(remapped[:, 2, 1], remapped[:, 3, 1]).tolist()
+    return [
+        BoundingBox(box.category, left, top, right, bottom)
+        for box, left, top, right, bottom in zip(boxes, lefts, tops, rights, bottoms)
+    ]
+
+
+def transform_keypoints(
+    keypoints: List[Keypoint], homography_matrix: np.ndarray
+) -> List[Keypoint]:
+    """Remaps a list of Keypoints using the homography matrix.
+
+    Short lists use transform_keypoint, since batching only pays off once there are a few
+    keypoints.
+
+    Args:
+        keypoints (List[Keypoint]):
+            The keypoints to remap.
+        homography_matrix (np.ndarray):
+            A homography matrix.
+
+    Returns:
+        A list of Keypoints that have been transformed by the homography.
+    """
+    if len(keypoints) < 4:
+        return [transform_keypoint(keypoint, homography_matrix) for keypoint in keypoints]
+    points = np.array(
+        [(keypoint.keypoint.x, keypoint.keypoint.y) for keypoint in keypoints],
+        dtype=np.float64,
+    )
+    remapped_points = transform_points(points, homography_matrix).tolist()
+    remapped_boxes = transform_boxes(
+        [keypoint.bounding_box for keypoint in keypoints], homography_matrix
+    )
+    return [
+        Keypoint(Point(*point), box, do_keypoint_validation=False)
+        for point, box in zip(remapped_points, remapped_boxes)
+    ]
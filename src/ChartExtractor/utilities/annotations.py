@@ -5,10 +5,36 @@ It also provides helper functions for constructing these objects from YOLO forma
 
 # Built-in Imports
 from dataclasses import dataclass
+from functools import lru_cache
 import json
-from typing import Dict, List, Tuple
+import struct
+from typing import Dict, List, Mapping, Tuple, Union
 import warnings
 
+# External Imports
+import numpy as np
+
+
+# A keypoint packed for binary label caches: a category id, then the normalized box center,
+# box size, and keypoint as float32s (c x y w h kpx kpy).
+KEYPOINT_STRUCT: struct.Struct = struct.Struct("<Bffffff")
+
+
+@lru_cache(maxsize=16)
+def yolo_float_template(number_of_values: int, precision: int) -> str:
+    """Builds a printf-style template for space separated floats in a yolo label line.
+
+    Args:
+        `number_of_values` (int):
+            The number of floats in the template.
+        `precision` (int):
+            The number of decimal places to write each float with.
+
+    Returns:
+        A template like " %.8f %.8f" with a leading space before each float.
+    """
+    return f" %.{precision}f" * number_of_values
+
 
 class Point:
     """The `Point` class is a struct which contains an x and y value for a point.
@@ -20,6 +46,8 @@ class Point:
             The y coordinate for the point.
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         """inits this point."""
         self.x = x
@@ -40,7 +68,7 @@ class Point:
     
     def to_dict(self) -> str:
         """Returns a json serialized version of the point."""
-        return vars(self)
+        return {"x": self.x, "y": self.y}
 
 
 @dataclass
@@ -67,10 +95,17 @@ class BoundingBox:
             It requires the original image dimensions and a dictionary mapping category IDs to
             category names.
 
+        `from_yolo_batch(yolo_lines: List[str], image_width: int, image_height: int, id_to_category: Dict[int, str])`:
+            Constructs a list of `BoundingBox`es from many lines of a YOLO formatted labels file,
+            converting all of their coordinates at once.
+
         `from_coco(coco_annotation: Dict, categories: List[Dict])`:
             Constructs a `BoundingBox` from an annotation in a COCO data JSON file.
             It requires the annotation dictionary and a list of category dictionaries.
 
+        `from_coco_many(coco_annotations: List[Dict], categories: List[Dict])`:
+            Constructs a `BoundingBox` for each annotation in a COCO data JSON file.
+
 
     Properties :
         `center` (Tuple[int]):
@@ -82,12 +117,19 @@ class BoundingBox:
     Methods :
         `to_yolo(image_width: int, image_height: int, category_to_int: Dict[str, int]) -> str`:
             Writes a yolo formatted string using this bounding box's data.
+        `to_yolo_many(boxes: List[BoundingBox], image_width: int, image_height: int, category_to_id: Dict[str, int]) -> str`:
+            Writes the yolo formatted lines for many bounding boxes at once.
         `validate_box_values(cls, left: float, top: float, right: float, bottom: float) -> None`:
             Validates the box parameters and throws a value error if left > right or top > bottom.
             Also issues a warning for the case when left == right or top == bottom letting the user
             know that they are constructing a degenerate rectangle.
     """
 
+    # Many boxes are made per image, so they are kept small and without an instance dict.
+    __slots__ = ("category", "left", "top", "right", "bottom")
+    # The exact keys from_dict accepts, which are also the keys to_dict writes.
+    DICT_KEYS = frozenset(__slots__)
+
     category: str
     left: float
     top: float
@@ -152,28 +194,117 @@ class BoundingBox:
         return BoundingBox(category, left, top, right, bottom)
 
     @staticmethod
-    def from_coco(coco_annotation: Dict, categories: List[Dict]):
+    def from_yolo_batch(
+        yolo_lines: List[str],
+        image_width: int,
+        image_height: int,
+        id_to_category: Dict[int, str],
+    ) -> List["BoundingBox"]:
+        """Constructs `BoundingBox`es from many lines of a yolo formatted labels file at once.
+
+        Gives the same boxes as calling `from_yolo` on each line, but the coordinates of every
+        line are parsed into one array and converted together.
+
+        Args :
+            `yolo_lines` (List[str]):
+                Strings in the yolo label format (c x y w h).
+            `image_width` (int):
+                The original image's width.
+            `image_height` (int):
+                The original image's height.
+            `id_to_category` (Dict):
+                A dictionary that maps the number id in the label to the category.
+
+        Returns:
+            A list of `BoundingBox` objects containing each yolo line's data, in order.
+        """
+        if len(yolo_lines) == 0:
+            return []
+        data = [line.split() for line in yolo_lines]
+        category_ids = [int(d[0]) for d in data]
+        x, y, w, h = (
+            np.array([d[1:5] for d in data], dtype=np.float64)
+            * np.array([image_width, image_height, image_width, image_height])
+        ).T
+        sides = np.stack(
+            (
+                x - (1 / 2) * w,
+                y - (1 / 2) * h,
+                x + (1 / 2) * w,
+                y + (1 / 2) * h,
+            ),
+            axis=1,
+        ).tolist()
+        boxes: List[BoundingBox] = []
+        for category_id, (left, top, right, bottom) in zip(category_ids, sides):
+            category = id_to_category.get(category_id)
+            if category is None:
+                raise ValueError(
+                    f"Category {category_id} not found in the id_to_category dictionary."
+                )
+            boxes.append(BoundingBox(category, left, top, right, bottom))
+        return boxes
+
+    @staticmethod
+    def from_coco(
+        coco_annotation: Dict, categories: Union[List[Dict], Mapping[int, str]]
+    ):
         """Constructs a `BoundingBox` from an annotation in a coco data json file.
 
         Args :
             `coco_annotation` (Dict): A bounding box annotation from the 'annotations' section.
-            `categories` (List[Dict]): A list of dictionaries containing their numeric ids and categories.
+            `categories` (Union[List[Dict], Mapping[int, str]]): A list of dictionaries containing
+                their numeric ids and categories, or a mapping from those ids to the categories.
 
         Returns:
             A `BoundingBox` object containing the coco annotation's data.
         """
+        if not isinstance(categories, Mapping):
+            categories = BoundingBox.coco_id_to_category(categories)
         left, top, w, h = coco_annotation["bbox"]
         right, bottom = left + w, top + h
         try:
-            category = list(
-                filter(lambda c: c["id"] == coco_annotation["category_id"], categories)
-            )[0].get("name")
-        except IndexError:
+            category = categories[coco_annotation["category_id"]]
+        except KeyError:
             raise ValueError(
                 f"Category {int(coco_annotation['category_id'])} not found in the categories list."
             )
         return BoundingBox(category, left, top, right, bottom)
-    
+
+    @staticmethod
+    def from_coco_many(
+        coco_annotations: List[Dict], categories: List[Dict]
+    ) -> List["BoundingBox"]:
+        """Constructs a `BoundingBox` for each annotation in a coco data json file.
+
+        The categories are only turned into a lookup table once for all of the annotations.
+
+        Args :
+            `coco_annotations` (List[Dict]): Bounding box annotations from the 'annotations' section.
+            `categories` (List[Dict]): A list of dictionaries containing their numeric ids and categories.
+
+        Returns:
+            A list of `BoundingBox` objects containing each coco annotation's data, in order.
+        """
+        id_to_category: Dict[int, str] = BoundingBox.coco_id_to_category(categories)
+        return [
+            BoundingBox.from_coco(coco_annotation, id_to_category)
+            for coco_annotation in coco_annotations
+        ]
+
+    @staticmethod
+    def coco_id_to_category(categories: List[Dict]) -> Dict[int, str]:
+        """Maps the numeric ids in a coco data json file's 'categories' section to their names.
+
+        Args :
+            `categories` (List[Dict]): A list of dictionaries containing their numeric ids and categories.
+
+        Returns:
+            A dictionary mapping each id to its category. If an id is repeated, its first
+            category is used.
+        """
+        return {c["id"]: c.get("name") for c in reversed(categories)}
+
     @staticmethod
     def from_dict(bbox_dict: Dict[str, float]):
         """Constructs a `BoundingBox` from a dictionary of arguments.
@@ -182,10 +313,23 @@ class BoundingBox:
             `bbox_dict` (Dict[str, float]):
                 A dictionary containing entries corresponding to the four bounding box sides.
 
+        Raises:
+            TypeError: If the dictionary's keys are not exactly the category and four sides.
+
         Returns:
             A `BoundingBox` object containing the data from the dictionary.
         """
-        return BoundingBox(**bbox_dict)
+        if bbox_dict.keys() != BoundingBox.DICT_KEYS:
+            raise TypeError(
+                f"A bounding box dictionary needs exactly the keys {sorted(BoundingBox.DICT_KEYS)} (got {sorted(bbox_dict)})."
+            )
+        return BoundingBox(
+            bbox_dict["category"],
+            bbox_dict["left"],
+            bbox_dict["top"],
+            bbox_dict["right"],
+            bbox_dict["bottom"],
+        )
     
     @classmethod
     def validate_box_values(
@@ -306,11 +450,68 @@ class BoundingBox:
         y /= image_height
         w = (self.right - self.left) / image_width
         h = (self.bottom - self.top) / image_height
-        return f"{c} {x:.{precision}f} {y:.{precision}f} {w:.{precision}f} {h:.{precision}f}"
+        return f"{c}" + yolo_float_template(4, precision) % (x, y, w, h)
+
+    @staticmethod
+    def to_yolo_many(
+        boxes: List["BoundingBox"],
+        image_width: int,
+        image_height: int,
+        category_to_id: Dict[str, int],
+        precision: int = 8,
+    ) -> str:
+        """Writes many `BoundingBox`es into the contents of a yolo label file at once.
+
+        Gives the same lines as calling `to_yolo` on each box, but normalizes every box's
+        coordinates together.
+
+        Args :
+            `boxes` (List[BoundingBox]):
+                The boxes to write.
+            `image_width` (int):
+                The image's width that the boxes belong to.
+            `image_height` (int):
+                The image's height that the boxes belong to.
+            `category_to_id` (Dict[str, int]):
+                A dictionary that maps the category string to an id (integer).
+            `precision` (int):
+                The number of decimal places to round yolo output to.
+                Defaults to 8 decimal places.
+
+        Returns:
+            The yolo lines for the boxes, in order, joined by newlines.
+        """
+        if len(boxes) == 0:
+            return ""
+        category_ids = [category_to_id[box.category] for box in boxes]
+        left, top, right, bottom = np.array(
+            [(box.left, box.top, box.right, box.bottom) for box in boxes],
+            dtype=np.float64,
+        ).T
+        yolo_values = np.stack(
+            (
+                (left + (1 / 2) * (right - left)) / image_width,
+                (top + (1 / 2) * (bottom - top)) / image_height,
+                (right - left) / image_width,
+                (bottom - top) / image_height,
+            ),
+            axis=1,
+        ).tolist()
+        template: str = yolo_float_template(4, precision)
+        return "\n".join(
+            f"{c}" + template % tuple(values)
+            for c, values in zip(category_ids, yolo_values)
+        )
 
     def to_dict(self) -> dict:
         """Returns a dictionary with all the attributes of this """
-        return vars(self)
+        return {
+            "category": self.category,
+            "left": self.left,
+            "top": self.top,
+            "right": self.right,
+            "bottom": self.bottom,
+        }
 
 
 @dataclass
@@ -351,8 +552,15 @@ class Keypoint:
         `validate_keypoint(cls, bounding_box: BoundingBox, keypoint: Point) -> None`:
             Validates that a keypoint lies within the specified bounding box.
             Raises a ValueError if the keypoint is outside the bounding box.
+        `validate_many(cls, points: np.ndarray, boxes: np.ndarray) -> np.ndarray`:
+            Validates that many keypoints lie within their bounding boxes at once.
+            Raises a ValueError naming the first keypoint outside its bounding box.
+        `pack(self, category_to_id: Dict[str, int], image_width: int, image_height: int) -> bytes`:
+            Packs this `Keypoint` into bytes for a binary label cache. `unpack` reads it back.
     """
 
+    __slots__ = ("keypoint", "bounding_box")
+
     keypoint: Point
     bounding_box: BoundingBox
 
@@ -452,6 +660,41 @@ class Keypoint:
             err_msg += f"(Keypoint:{(keypoint.x, keypoint.y)}, BoundingBox:{str(bounding_box)})"
             raise ValueError(err_msg)
 
+    @classmethod
+    def validate_many(cls, points: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+        """Validates that many keypoints each lie within their bounding box at once.
+
+        The vectorized counterpart to `validate_keypoint`, for checking whole label files.
+
+        Args:
+            points (np.ndarray):
+                An (N, 2) array of keypoints' x and y coordinates.
+            boxes (np.ndarray):
+                An (N, 4) array of the left, top, right, and bottom of each keypoint's box.
+
+        Raises:
+            ValueError: If any keypoint's coordinates are not within its bounding box.
+
+        Returns:
+            A boolean mask of the keypoints within their boxes, which is all True when no
+            error is raised. Empty inputs give an empty mask.
+        """
+        # Reshaping keeps empty inputs, like an empty label file, two dimensional.
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+        in_bounds: np.ndarray = (
+            (boxes[:, 0] <= points[:, 0])
+            & (points[:, 0] <= boxes[:, 2])
+            & (boxes[:, 1] <= points[:, 1])
+            & (points[:, 1] <= boxes[:, 3])
+        )
+        if not in_bounds.all():
+            ix: int = int(np.argmin(in_bounds))
+            err_msg: str = f"Keypoint {ix} is not in the bounding box intended to enclose it "
+            err_msg += f"(Keypoint:{tuple(points[ix].tolist())}, Box:{boxes[ix].tolist()})"
+            raise ValueError(err_msg)
+        return in_bounds
+
     @property
     def category(self) -> str:
         """This `Keypoint`'s category."""
@@ -653,11 +896,89 @@ class Keypoint:
             if not in_bounds:
                 yolo_line += " 0 0 0"
             else:
-                yolo_line += f" {keypoint_x:.{precision}f} {keypoint_y:.{precision}f} 2"
+                yolo_line += yolo_float_template(2, precision) % (keypoint_x, keypoint_y)
+                yolo_line += " 2"
         else:
-            yolo_line += f" {keypoint_x:.{precision}f} {keypoint_y:.{precision}f}"
+            yolo_line += yolo_float_template(2, precision) % (keypoint_x, keypoint_y)
         return yolo_line
     
+    def pack(
+        self,
+        category_to_id: Dict[str, int],
+        image_width: int,
+        image_height: int,
+    ) -> bytes:
+        """Packs this `Keypoint` into bytes for a binary label cache.
+
+        Holds the same values as `to_yolo` without its encode_hidden option, in
+        `KEYPOINT_STRUCT`'s fixed 25 byte layout, so caches can be read back without parsing
+        text. The coordinates are stored as float32s.
+
+        Args :
+            `category_to_id` (Dict[str, int]):
+                A dictionary that maps the category string to an id from 0 to 255.
+            `image_width` (int):
+                The image's width that this `Keypoint` belongs to.
+            `image_height` (int):
+                The image's height that this `Keypoint` belongs to.
+
+        Returns:
+            The packed `Keypoint`.
+        """
+        x, y = self.center
+        return KEYPOINT_STRUCT.pack(
+            category_to_id[self.category],
+            x / image_width,
+            y / image_height,
+            (self.right - self.left) / image_width,
+            (self.bottom - self.top) / image_height,
+            self.keypoint.x / image_width,
+            self.keypoint.y / image_height,
+        )
+
+    @staticmethod
+    def unpack(
+        buffer: bytes,
+        id_to_category: Dict[int, str],
+        image_width: int,
+        image_height: int,
+        do_keypoint_validation: bool = True,
+    ) -> "Keypoint":
+        """Constructs a `Keypoint` from bytes written by `pack`.
+
+        Args :
+            `buffer` (bytes):
+                The packed `Keypoint`.
+            `id_to_category` (Dict):
+                A dictionary that maps the id number in the buffer to the category.
+            `image_width` (int):
+                The original image's width.
+            `image_height` (int):
+                The original image's height.
+            `do_keypoint_validation` (bool):
+                Whether or not to do validation on whether the keypoint is truly within
+                the bounding box.
+
+        Returns:
+            A `Keypoint` object containing the buffer's data.
+        """
+        category_id, x, y, w, h, keypoint_x, keypoint_y = KEYPOINT_STRUCT.unpack(buffer)
+        category = id_to_category.get(category_id)
+        if category is None:
+            raise ValueError(
+                f"Category {category_id} not found in the id_to_category dictionary."
+            )
+        x, y, w, h = x * image_width, y * image_height, w * image_width, h * image_height
+        bounding_box = BoundingBox(
+            category,
+            x - (1 / 2) * w,
+            y - (1 / 2) * h,
+            x + (1 / 2) * w,
+            y + (1 / 2) * h,
+        )
+        keypoint = Point(keypoint_x * image_width, keypoint_y * image_height)
+        return Keypoint(keypoint, bounding_box, do_keypoint_validation)
+
     def to_dict(self) -> dict:
         """Converts this keypoint to a dictionary of its variables."""
         return {
@@ -3,8 +3,11 @@
 # Built-in Imports
 from typing import Callable, List, Tuple
 
+# External Imports
+import numpy as np
+
 # Internal Imports
-from ..utilities.detections import Detection
+from ..utilities.detections import Detection, DetectionBatch
 from ..utilities.tiling import correct_annotation_coords
 
 
@@ -180,3 +183,59 @@ def untile_detections(
     ]
     untiled_detections: List[Detection] = flatten_list(flatten_list(untiled_detections))
     return untiled_detections
+
+
+def untile_detection_batches(
+    tiled_detections: List[List[DetectionBatch]],
+    tile_width: int,
+    tile_height: int,
+    horizontal_overlap_ratio: float,
+    vertical_overlap_ratio: float,
+) -> DetectionBatch:
+    """Squashes the detections on each tile into one batch on the main image.
+
+    Matches untile_detections, but moves every detection with a single array addition
+    instead of rebuilding each annotation.
+
+    Args:
+        `tiled_detections` (List[List[DetectionBatch]]):
+            Rows of the detections made on each tile. There must be at least one tile, and
+            every batch must come from the same model.
+        `tile_width` (int):
+            The width of each tile.
+        `tile_height` (int):
+            The height of each tile.
+        `horizontal_overlap_ratio` (float):
+            The amount of left-right overlap between tiles.
+        `vertical_overlap_ratio` (float):
+            The amount of top-bottom overlap between tiles.
+
+    Returns:
+        All of the detections in the main image's coordinates.
+    """
+    batches: List[DetectionBatch] = [batch for row in tiled_detections for batch in row]
+    tile_origins: np.ndarray = np.array(
+        [
+            (
+                int(ix * tile_width * (1 - horizontal_overlap_ratio)),
+                int(iy * tile_height * (1 - vertical_overlap_ratio)),
+            )
+            for iy, row in enumerate(tiled_detections)
+            for ix in range(len(row))
+        ],
+        dtype=np.float64,
+    )
+    detection_origins: np.ndarray = np.repeat(
+        tile_origins, [len(batch) for batch in batches], axis=0
+    )
+    return DetectionBatch(
+        xyxy=np.concatenate([batch.xyxy for batch in batches]) + np.tile(detection_origins, 2),
+        confidence=np.concatenate([batch.confidence for batch in batches]),
+        category=np.concatenate([batch.category for batch in batches]),
+        names=batches[0].names,
+        keypoints=(
+            None
+            if batches[0].keypoints is None
+            else np.concatenate([batch.keypoints for batch in batches]) + detection_origins
+        ),
+    )
@@ -4,14 +4,20 @@ This class is used to store the output of an object detection model, including:
 
 * The predicted location of the object, represented by either a BoundingBox or a Keypoint instance (depending on the model's output format).
 * The confidence score assigned by the model to this detection (a float between 0.0 and 1.0).
+
+It also defines the DetectionBatch class, which holds many detections as parallel numpy arrays
+so that they can be filtered and transformed without building a Detection for each one.
 """
 
 # Built-in Imports
 from dataclasses import dataclass
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Union
+
+# External Imports
+import numpy as np
 
 # Internal Imports
-from ..utilities.annotations import BoundingBox, Keypoint
+from ..utilities.annotations import BoundingBox, Keypoint, Point
 
 
 @dataclass
@@ -55,3 +61,104 @@ class Detection:
             "annotation": self.annotation.to_dict(),
             "confidence": self.confidence
         }
+
+
+@dataclass
+class DetectionBatch:
+    """Represents many detections of the same annotation type as parallel arrays.
+
+    Attributes:
+        xyxy:
+            An (N, 4) array of the (left, top, right, bottom) of each detection's box.
+        confidence:
+            An (N,) array of each detection's confidence score.
+        category:
+            An (N,) integer array of each detection's index into names.
+        names:
+            The category names, indexed by the values in category.
+        keypoints:
+            An (N, 2) array of each detection's (x, y) keypoint, or None if the detections
+            are bounding boxes.
+    """
+
+    xyxy: np.ndarray
+    confidence: np.ndarray
+    category: np.ndarray
+    names: List[str]
+    keypoints: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Gets the number of detections in the batch."""
+        return len(self.confidence)
+
+    @staticmethod
+    def from_detections(detections: List[Detection]) -> "DetectionBatch":
+        """Creates a `DetectionBatch` from a list of detections.
+
+        Args:
+            detections (List[Detection]):
+                The detections to batch. Must all be BoundingBoxes or all be Keypoints.
+
+        Returns:
+            A `DetectionBatch` holding the same detections in the same order.
+        """
+        has_keypoints: bool = len(detections) > 0 and isinstance(
+            detections[0].annotation, Keypoint
+        )
+        boxes: List[BoundingBox] = [
+            det.annotation.bounding_box if has_keypoints else det.annotation
+            for det in detections
+        ]
+        names: List[str] = sorted({box.category for box in boxes})
+        name_indices: Dict[str, int] = {name: ix for ix, name in enumerate(names)}
+        return DetectionBatch(
+            xyxy=np.array([box.box for box in boxes], dtype=np.float64).reshape(-1, 4),
+            confidence=np.array([det.confidence for det in detections], dtype=np.float64),
+            category=np.array([name_indices[box.category] for box in boxes], dtype=np.int64),
+            names=names,
+            keypoints=(
+                np.array(
+                    [(det.annotation.keypoint.x, det.annotation.keypoint.y) for det in detections],
+                    dtype=np.float64,
+                )
+                if has_keypoints
+                else None
+            ),
+        )
+
+    def select(self, selection: np.ndarray) -> "DetectionBatch":
+        """Selects a subset of the detections.
+
+        Args:
+            selection (np.ndarray):
+                A boolean mask or an array of indices into the batch.
+
+        Returns:
+            A new `DetectionBatch` with only the selected detections.
+        """
+        return DetectionBatch(
+            xyxy=self.xyxy[selection],
+            confidence=self.confidence[selection],
+            category=self.category[selection],
+            names=self.names,
+            keypoints=None if self.keypoints is None else self.keypoints[selection],
+        )
+
+    def to_detections(self) -> List[Detection]:
+        """Converts the batch back to a list of Detection objects."""
+        categories: List[str] = [self.names[ix] for ix in self.category.tolist()]
+        boxes: List[BoundingBox] = [
+            BoundingBox(category, *box)
+            for category, box in zip(categories, self.xyxy.tolist())
+        ]
+        if self.keypoints is None:
+            return [
+                Detection(box, confidence)
+                for box, confidence in zip(boxes, self.confidence.tolist())
+            ]
+        return [
+            Detection(Keypoint(Point(*point), box), confidence)
+            for point, box, confidence in zip(
+                self.keypoints.tolist(), boxes, self.confidence.tolist()
+            )
+        ]
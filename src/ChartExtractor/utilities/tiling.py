@@ -2,6 +2,7 @@
 
 The `tile_image` function splits a PIL `Image` object into a grid of tiles with a specified size and overlap ratio.
 It handles padding the image with black pixels if necessary to ensure all tiles fit perfectly within the image boundaries.
+The `tile_image_array` function does the same for an image that has already been decoded to a numpy array.
 
 The `tile_annotations` function is a sister function to `tile_image` and can be used to tile annotations associated with the
 image using (nearly) the same parameters as `tile_image`. It assumes annotations implement a `'box'` property representing
@@ -13,6 +14,9 @@ import math
 from PIL import Image
 from typing import List, Literal, Tuple, Union
 
+# External Imports
+import numpy as np
+
 # Internal Imports
 from ..utilities.annotations import BoundingBox, Keypoint
 
@@ -67,8 +71,80 @@ def tile_image(
     return images
 
 
+def tile_image_array(
+    image: np.ndarray,
+    slice_width: int,
+    slice_height: int,
+    horizontal_overlap_ratio: float,
+    vertical_overlap_ratio: float,
+) -> List[List[np.ndarray]]:
+    """Splits a larger image array into smaller 'tiles'.
+
+    Matches tile_image, but slices an image that has already been decoded rather than
+    cropping and converting each tile. The image is padded with black on the right and bottom
+    once, then every tile is taken as a strided view of that single buffer, so no tile is
+    copied.
+
+    Args:
+        `image` (np.ndarray):
+            The image to tile, with shape (height, width, channels).
+        `slice_height` (int):
+            The height of each slice.
+        `slice_width` (int):
+            The width of each slice.
+        `horizontal_overlap_ratio` (float):
+            The amount of left-right overlap between slices.
+        `vertical_overlap_ratio` (float):
+            The amount of top-bottom overlap between slices.
+
+    Returns:
+        A list of rows of sliced images.
+    """
+    validate_tile_parameters(
+        image,
+        slice_width,
+        slice_height,
+        horizontal_overlap_ratio,
+        vertical_overlap_ratio,
+    )
+    image_height, image_width = image.shape[:2]
+    tile_coordinates: List[List[Tuple[int, int, int, int]]] = generate_tile_coordinates(
+        image_width,
+        image_height,
+        slice_width,
+        slice_height,
+        horizontal_overlap_ratio,
+        vertical_overlap_ratio,
+    )
+
+    # The tile grid is uniform, so the tiles are a strided window over the padded image.
+    number_of_rows: int = len(tile_coordinates)
+    number_of_columns: int = len(tile_coordinates[0])
+    horizontal_step: int = round(slice_width * (1 - horizontal_overlap_ratio))
+    vertical_step: int = round(slice_height * (1 - vertical_overlap_ratio))
+    padded_width: int = (number_of_columns - 1) * horizontal_step + slice_width
+    padded_height: int = (number_of_rows - 1) * vertical_step + slice_height
+    padded_image: np.ndarray = image[:padded_height, :padded_width]
+    if padded_image.shape[:2] != (padded_height, padded_width):
+        cropped_image: np.ndarray = padded_image
+        padded_image = np.zeros(
+            (padded_height, padded_width) + image.shape[2:], dtype=image.dtype
+        )
+        padded_image[: cropped_image.shape[0], : cropped_image.shape[1]] = cropped_image
+    row_stride, column_stride = padded_image.strides[:2]
+    tiles: np.ndarray = np.lib.stride_tricks.as_strided(
+        padded_image,
+        shape=(number_of_rows, number_of_columns, slice_height, slice_width)
+        + padded_image.shape[2:],
+        strides=(vertical_step * row_stride, horizontal_step * column_stride)
+        + padded_image.strides,
+        writeable=False,
+    )
+    return [list(row) for row in tiles]
+
+
 def validate_tile_parameters(
-    image: Image.Image,
+    image: Union[Image.Image, np.ndarray],
     slice_width: int,
     slice_height: int,
     horizontal_overlap_ratio: float,
@@ -77,8 +153,8 @@ def validate_tile_parameters(
     """Validates the parameters for the function 'tile_image'.
 
     Args:
-        `image` (PIL Image):
-            The image to tile.
+        `image` (Union[PIL Image, np.ndarray]):
+            The image to tile, either as a PIL image or a (height, width, channels) array.
         `slice_height` (int):
             The height of each slice.
         `slice_width` (int):
@@ -94,11 +170,14 @@ def validate_tile_parameters(
             not within (0, image_height), or horizontal/vertical overlap
             ratio not in (0, 1].
     """
-    if not 0 < slice_width <= image.size[0]:
+    image_size: Tuple[int, int] = (
+        image.size if isinstance(image, Image.Image) else image.shape[1::-1]
+    )
+    if not 0 < slice_width <= image_size[0]:
         raise ValueError(
             f"slice_width must be between 1 and the image's width (slice_width passed was {slice_width})."
         )
-    if not 0 < slice_height <= image.size[1]:
+    if not 0 < slice_height <= image_size[1]:
         raise ValueError(
             f"slice_height must be between 1 and the image's height (slice_height passed was {slice_height})."
         )
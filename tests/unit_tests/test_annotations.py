@@ -1,5 +1,8 @@
 """Tests for the annotations module."""
 
+# Built-in Imports
+import re
+
 # External Imports
 import pytest
 
@@ -7,6 +10,29 @@ import pytest
 from ChartExtractor.utilities.annotations import BoundingBox, Keypoint, Point
 
 
+# The messages the annotation classes raise and warn with, compiled once for every test.
+LEFT_GREATER_THAN_RIGHT = re.compile("left side greater than its right side")
+TOP_GREATER_THAN_BOTTOM = re.compile("top side greater than its bottom side")
+LEFT_EQUALS_RIGHT = re.compile("left side equals its right side")
+TOP_EQUALS_BOTTOM = re.compile("top side equals its bottom side")
+ALL_SIDES_EQUAL = re.compile("box's parameters are equal")
+YOLO_CATEGORY_NOT_FOUND = re.compile("not found in the id_to_category dictionary")
+COCO_CATEGORY_NOT_FOUND = re.compile("not found in the categories list")
+KEYPOINT_NOT_IN_BOX = re.compile("not in the bounding box")
+
+
+@pytest.fixture(scope="module")
+def unit_box() -> BoundingBox:
+    """Creates the unit bounding box shared by tests that only read from it."""
+    return BoundingBox("Test", 0, 0, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def unit_point() -> Point:
+    """Creates a point inside the unit bounding box."""
+    return Point(0.25, 0.25)
+
+
 class TestBoundingBox:
     """Tests the BoundingBox class."""
 
@@ -40,6 +66,20 @@ class TestBoundingBox:
         with pytest.raises(TypeError):
             BoundingBox.from_dict(bb_dict)
 
+    @pytest.mark.parametrize("missing_key", ["left", "right", "top", "bottom", "category"])
+    def test_from_dict_missing_key(self, missing_key):
+        """Tests the from_dict constructor when the dictionary is missing an entry."""
+        bb_dict = {
+            "left": 1,
+            "right": 2,
+            "top": 3,
+            "bottom": 4,
+            "category": "Test"
+        }
+        del bb_dict[missing_key]
+        with pytest.raises(TypeError):
+            BoundingBox.from_dict(bb_dict)
+
     # from_yolo
     def test_from_yolo(self):
         """Tests the from_yolo constructor."""
@@ -60,10 +100,37 @@ class TestBoundingBox:
         image_height = 2
         id_to_category = {1: "Test"}
         with pytest.raises(
-            ValueError, match="not found in the id_to_category dictionary"
+            ValueError, match=YOLO_CATEGORY_NOT_FOUND
         ):
             BoundingBox.from_yolo(yolo_line, image_width, image_height, id_to_category)
 
+    def test_from_yolo_batch(self):
+        """Tests that the from_yolo_batch constructor matches calling from_yolo on each line."""
+        yolo_lines = [
+            "0 0.25 0.25 0.5 0.5",
+            "1 0.5 0.5 0.25 0.75",
+            "0 0.1 0.9 0.2 0.2",
+            "1 0.7 0.3 0.33 0.125",
+        ]
+        image_width = 640
+        image_height = 480
+        id_to_category = {0: "Test", 1: "Other"}
+        created_bboxes = BoundingBox.from_yolo_batch(
+            yolo_lines, image_width, image_height, id_to_category
+        )
+        assert created_bboxes == [
+            BoundingBox.from_yolo(line, image_width, image_height, id_to_category)
+            for line in yolo_lines
+        ]
+
+    def test_from_yolo_batch_category_not_in_id_to_category_dict(self):
+        """Tests the from_yolo_batch constructor where a supplied id is not in the id_to_category dictionary."""
+        yolo_lines = ["1 0.25 0.25 0.5 0.5", "0 0.25 0.25 0.5 0.5"]
+        with pytest.raises(
+            ValueError, match=YOLO_CATEGORY_NOT_FOUND
+        ):
+            BoundingBox.from_yolo_batch(yolo_lines, 2, 2, {1: "Test"})
+
     # from_coco
     def test_from_coco(self):
         """Tests the from_coco constructor."""
@@ -87,46 +154,72 @@ class TestBoundingBox:
             "bbox": [0, 0, 1, 1],
         }
         categories = [{"id": 1, "name": "Test"}]
-        with pytest.raises(ValueError, match="not found in the categories list"):
+        with pytest.raises(ValueError, match=COCO_CATEGORY_NOT_FOUND):
             BoundingBox.from_coco(coco_annotation, categories)
 
+    def test_from_coco_many(self):
+        """Tests that the from_coco_many constructor matches calling from_coco on each annotation."""
+        coco_annotations = [
+            {"id": 0, "image_id": 0, "category_id": 0, "bbox": [0, 0, 1, 1]},
+            {"id": 1, "image_id": 0, "category_id": 1, "bbox": [2, 3, 4, 5]},
+        ]
+        categories = [{"id": 0, "name": "Test"}, {"id": 1, "name": "Other"}]
+        created_bboxes = BoundingBox.from_coco_many(coco_annotations, categories)
+        assert created_bboxes == [
+            BoundingBox.from_coco(coco_annotation, categories)
+            for coco_annotation in coco_annotations
+        ]
+
+    def test_from_coco_many_category_not_found(self):
+        """Tests the from_coco_many constructor where a supplied category is not in the list of category dictionaries."""
+        coco_annotations = [
+            {"id": 0, "image_id": 0, "category_id": 0, "bbox": [0, 0, 1, 1]},
+        ]
+        categories = [{"id": 1, "name": "Test"}]
+        with pytest.raises(ValueError, match=COCO_CATEGORY_NOT_FOUND):
+            BoundingBox.from_coco_many(coco_annotations, categories)
+
     # validate_box_values
-    def test_validate_box_values_left_greater_than_right(self):
-        """Tests the validate_box_values classmethod with invalid parameters (left > right)."""
-        with pytest.raises(ValueError, match="left side greater than its right side"):
-            BoundingBox("Test", 1, 0, 0, 1)
-
-    def test_validate_box_values_top_greater_than_bottom(self):
-        """Tests the validate_box_values classmethod with invalid parameters (top > bottom)."""
-        with pytest.raises(ValueError, match="top side greater than its bottom side"):
-            BoundingBox("Test", 0, 1, 1, 0)
-
-    def test_validate_box_values_left_eq_right(self):
-        """Tests the validate_box_values classmethod with degenerate rectangle parameters (left == right)."""
-        with pytest.warns(UserWarning, match="left side equals its right side"):
-            BoundingBox("Test", 0, 0, 0, 1)
-
-    def test_validate_box_values_top_eq_bottom(self):
-        """Tests the validate_box_values classmethod with degenerate rectangle parameters (top == bottom)."""
-        with pytest.warns(UserWarning, match="top side equals its bottom side"):
-            BoundingBox("Test", 0, 0, 1, 0)
-
-    def test_validate_box_values_left_eq_right_top_eq_bottom(self):
-        """Tests the validate_box_values classmethod with degernate rectangle parameters (left == right == top == bottom)."""
-        with pytest.warns(UserWarning, match="box's parameters are equal"):
-            BoundingBox("Test", 0, 0, 0, 0)
+    @pytest.mark.parametrize(
+        "left,top,right,bottom,match",
+        [
+            (1, 0, 0, 1, LEFT_GREATER_THAN_RIGHT),
+            (0, 1, 1, 0, TOP_GREATER_THAN_BOTTOM),
+        ],
+    )
+    def test_validate_box_values_invalid(self, left, top, right, bottom, match):
+        """Tests the validate_box_values classmethod with invalid parameters (left > right or top > bottom)."""
+        with pytest.raises(ValueError, match=match):
+            BoundingBox("Test", left, top, right, bottom)
+
+    @pytest.mark.parametrize(
+        "left,top,right,bottom,match",
+        [
+            (0, 0, 0, 1, LEFT_EQUALS_RIGHT),
+            (0, 0, 1, 0, TOP_EQUALS_BOTTOM),
+            (0, 0, 0, 0, ALL_SIDES_EQUAL),
+        ],
+    )
+    def test_validate_box_values_degenerate(self, left, top, right, bottom, match):
+        """Tests the validate_box_values classmethod with degenerate rectangle parameters (left == right and/or top == bottom)."""
+        with pytest.warns(UserWarning, match=match):
+            BoundingBox("Test", left, top, right, bottom)
 
     # Center
-    def test_center(self):
+    def test_center(self, unit_box):
         """Tests the 'center' property."""
-        bbox = BoundingBox("Test", 0, 0, 1, 1)
-        assert (0.5, 0.5) == bbox.center
+        assert (0.5, 0.5) == unit_box.center
+
+    def test_center_after_changing_sides(self):
+        """Tests that the 'center' property follows changes to the box's sides."""
+        bbox = BoundingBox("a", 0, 0, 2, 2)
+        bbox.left = 1
+        assert (1.5, 1.0) == bbox.center
 
     # Box
-    def test_box(self):
+    def test_box(self, unit_box):
         """Tests the 'box' property."""
-        bbox = BoundingBox("Test", 0, 0, 1, 1)
-        assert [0, 0, 1, 1] == bbox.box
+        assert [0, 0, 1, 1] == unit_box.box
     
     def test_to_dict(self):
         """Tests the to_dict method."""
@@ -141,25 +234,39 @@ class TestBoundingBox:
         assert bbox.to_dict() == true_dict
 
     # to_yolo
-    def test_to_yolo(self):
+    def test_to_yolo(self, unit_box):
         """Tests the to_yolo method."""
-        bbox = BoundingBox("Test", 0, 0, 1, 1)
         image_width = 2
         image_height = 2
         category_to_id = {"Test": 0}
-        yolo_str = bbox.to_yolo(image_width, image_height, category_to_id, 3)
+        yolo_str = unit_box.to_yolo(image_width, image_height, category_to_id, 3)
         assert yolo_str == "0 0.250 0.250 0.500 0.500"
 
+    def test_to_yolo_many(self):
+        """Tests that the to_yolo_many method matches calling to_yolo on each box."""
+        bboxes = [
+            BoundingBox("Test", 0, 0, 1, 1),
+            BoundingBox("Other", 13.5, 7.25, 100, 42.125),
+            BoundingBox("Test", 320, 0, 640, 480),
+        ]
+        image_width = 640
+        image_height = 480
+        category_to_id = {"Test": 0, "Other": 1}
+        yolo_str = BoundingBox.to_yolo_many(
+            bboxes, image_width, image_height, category_to_id, 5
+        )
+        assert yolo_str == "\n".join(
+            bbox.to_yolo(image_width, image_height, category_to_id, 5) for bbox in bboxes
+        )
+
 
 class TestKeypoint:
     """Tests the Keypoint class."""
 
     # Init
-    def test_init(self):
+    def test_init(self, unit_point, unit_box):
         """Tests the init function with valid parameters."""
-        kp = Point(0.25, 0.25)
-        bbox = BoundingBox("Test", 0, 0, 1, 1)
-        Keypoint(kp, bbox)
+        Keypoint(unit_point, unit_box)
     
     def test_from_dict(self):
         """Test the from_dict constructor."""
@@ -182,9 +289,9 @@ class TestKeypoint:
         assert Keypoint.from_dict(keypoint_dict) == true_keypoint
     
     # from_yolo
-    def test_from_yolo(self):
+    def test_from_yolo(self, unit_point, unit_box):
         """Tests the from_yolo constructor."""
-        true_kp = Keypoint(Point(0.25, 0.25), BoundingBox("Test", 0, 0, 1, 1))
+        true_kp = Keypoint(unit_point, unit_box)
         yolo_line = "0 0.25 0.25 0.5 0.5 0.125 0.125"
         image_width = 2
         image_height = 2
@@ -195,23 +302,28 @@ class TestKeypoint:
         assert true_kp == created_kp
 
     # validate_keyoint
-    def test_validate_keypoint_out_of_bounds_x(self):
-        """Tests the validate_keypoint method where the keypoint is not within the left-right bounds."""
-        # Left of box.
-        with pytest.raises(ValueError, match="not in the bounding box"):
-            Keypoint(Point(1, 1), BoundingBox("Test", 2, 0, 3, 2))
-        # Right of box.
-        with pytest.raises(ValueError, match="not in the bounding box"):
-            Keypoint(Point(4, 1), BoundingBox("Test", 2, 0, 3, 2))
-
-    def test_validate_keypoint_out_of_bounds_y(self):
-        """Tests the validate_keypoint method where the keypoint is not within the left-right bounds."""
-        # Above box
-        with pytest.raises(ValueError):
-            Keypoint(Point(1, 1), BoundingBox("Test", 0, 2, 2, 3))
-        # Below box
-        with pytest.raises(ValueError):
-            Keypoint(Point(1, 4), BoundingBox("Test", 0, 2, 2, 3))
+    @pytest.mark.parametrize(
+        "x,y,box",
+        [
+            (1, 1, (2, 0, 3, 2)),
+            (4, 1, (2, 0, 3, 2)),
+            (1, 1, (0, 2, 2, 3)),
+            (1, 4, (0, 2, 2, 3)),
+        ],
+        ids=["left_of_box", "right_of_box", "above_box", "below_box"],
+    )
+    def test_validate_keypoint_out_of_bounds(self, x, y, box):
+        """Tests the validate_keypoint method where the keypoint is not within the box's bounds."""
+        with pytest.raises(ValueError, match=KEYPOINT_NOT_IN_BOX):
+            Keypoint(Point(x, y), BoundingBox("Test", *box))
+
+    def test_validate_many(self):
+        """Tests the validate_many method with keypoints inside, on the edge of, and outside their boxes."""
+        boxes = [[0, 0, 2, 2], [2, 0, 3, 2], [0, 2, 2, 3]]
+        assert Keypoint.validate_many([[1, 1], [2, 2], [0, 3]], boxes).all()
+        with pytest.raises(ValueError, match="Keypoint 1 is not in the bounding box"):
+            Keypoint.validate_many([[1, 1], [4, 1], [1, 4]], boxes)
+        assert Keypoint.validate_many([], []).shape == (0,)
     
     def test_to_dict(self):
         """Tests the to_dict method."""
@@ -235,11 +347,18 @@ class TestKeypoint:
         assert kp_dict == true_dict
 
     # to_yolo
-    def test_to_yolo(self):
+    def test_to_yolo(self, unit_point, unit_box):
         """Tests the to_yolo method."""
-        kp = Keypoint(Point(0.25, 0.25), BoundingBox("Test", 0, 0, 1, 1))
+        kp = Keypoint(unit_point, unit_box)
         image_width = 2
         image_height = 2
         category_to_id = {"Test": 0}
         yolo_str = kp.to_yolo(image_width, image_height, category_to_id, 3)
         assert yolo_str == "0 0.250 0.250 0.500 0.500 0.125 0.125"
+
+    def test_pack_roundtrip(self, unit_point, unit_box):
+        """Tests that unpack reverses pack."""
+        kp = Keypoint(unit_point, unit_box)
+        packed = kp.pack({"Test": 0}, 2, 2)
+        assert len(packed) == 25
+        assert Keypoint.unpack(packed, {0: "Test"}, 2, 2) == kp
@@ -155,3 +155,23 @@ class TestClustering:
             and set([cluster.label for cluster in number_clusters])
             == set(EXPECTED_NUMBER_VALUES)
         )
+
+    def test_cluster_boxes_method_without_centers(self):
+        """Tests cluster_boxes with a method that does not take the boxes' centers."""
+
+        def cluster_by_row(bounding_boxes: List[BoundingBox]) -> List[int]:
+            return [int(box.top >= 10) for box in bounding_boxes]
+
+        bounding_boxes = [
+            BoundingBox("3", 0, 0, 5, 5),
+            BoundingBox("0", 5, 0, 10, 5),
+            BoundingBox("4", 0, 10, 5, 15),
+            BoundingBox("0", 5, 10, 10, 15),
+        ]
+        clusters = cluster_boxes(
+            bounding_boxes=bounding_boxes,
+            method=cluster_by_row,
+            unit="mmhg",
+        )
+
+        assert sorted(cluster.label for cluster in clusters) == ["30_mmhg", "40_mmhg"]
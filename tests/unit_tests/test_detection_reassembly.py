@@ -8,7 +8,7 @@ import pytest
 
 # Internal Imports
 from ChartExtractor.utilities.annotations import BoundingBox
-from ChartExtractor.utilities.detections import Detection
+from ChartExtractor.utilities.detections import Detection, DetectionBatch
 from ChartExtractor.utilities.tiling import tile_annotations
 from ChartExtractor.utilities import detection_reassembly
 
@@ -151,3 +151,25 @@ def test_untile_detections(test_detections):
     ]
     untiled_detections = untiled_detections(tiled_detections, 2, 2, 0.5, 0.5)
     assert test_detections == untiled_detections
+
+
+def test_untile_detection_batches(test_detections):
+    """Tests that untile_detection_batches matches untile_detections."""
+    tiled_detections = [
+        [test_detections[:2], test_detections[2:]],
+        [[], test_detections[1:3]],
+    ]
+    untiled_batch = detection_reassembly.untile_detection_batches(
+        [
+            [DetectionBatch.from_detections(tile_detections) for tile_detections in row]
+            for row in tiled_detections
+        ],
+        2,
+        2,
+        0.5,
+        0.5,
+    )
+    untiled_detections = detection_reassembly.untile_detections(
+        tiled_detections, 2, 2, 0.5, 0.5
+    )
+    assert untiled_batch.to_detections() == untiled_detections
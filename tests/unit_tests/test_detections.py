@@ -1,11 +1,11 @@
-"""Tests the detections module's Detection class."""
+"""Tests the detections module's Detection and DetectionBatch classes."""
 
 # External Imports
 import pytest
 
 # Internal Imports
 from ChartExtractor.utilities.annotations import BoundingBox, Keypoint, Point
-from ChartExtractor.utilities.detections import Detection
+from ChartExtractor.utilities.detections import Detection, DetectionBatch
 
 
 class TestDetection:
@@ -96,3 +96,33 @@ class TestDetection:
         
         assert det.to_dict() == true_dict
 
+
+class TestDetectionBatch:
+    """Tests the DetectionBatch class."""
+
+    def test_round_trip_bounding_box(self):
+        """Tests that bounding box detections survive conversion to and from a batch."""
+        dets = [
+            Detection(BoundingBox("B", 0, 2, 1, 3), 0.8),
+            Detection(BoundingBox("A", 4, 5, 6, 7), 0.6),
+        ]
+        batch = DetectionBatch.from_detections(dets)
+        assert len(batch) == 2
+        assert batch.names == ["A", "B"]
+        assert batch.to_detections() == dets
+
+    def test_round_trip_keypoint(self):
+        """Tests that keypoint detections survive conversion to and from a batch."""
+        dets = [
+            Detection(Keypoint(Point(0.5, 2.25), BoundingBox("Test", 0, 2, 1, 3)), 0.8),
+        ]
+        assert DetectionBatch.from_detections(dets).to_detections() == dets
+
+    def test_select(self):
+        """Tests selecting detections with a boolean mask."""
+        dets = [
+            Detection(BoundingBox("A", 0, 2, 1, 3), 0.8),
+            Detection(BoundingBox("B", 4, 5, 6, 7), 0.6),
+        ]
+        batch = DetectionBatch.from_detections(dets)
+        assert batch.select(batch.confidence > 0.7).to_detections() == dets[:1]
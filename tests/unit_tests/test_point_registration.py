@@ -0,0 +1,67 @@
+"""Tests the point_registration module's homography functions."""
+
+# External Imports
+import numpy as np
+import pytest
+
+# Internal Imports
+from ChartExtractor.point_registration.homography import (
+    transform_box,
+    transform_boxes,
+    transform_keypoint,
+    transform_keypoints,
+)
+from ChartExtractor.utilities.annotations import BoundingBox, Keypoint, Point
+
+
+@pytest.fixture()
+def homography_matrix() -> np.ndarray:
+    """Creates a homography matrix with rotation, scale, translation, and perspective."""
+    return np.array(
+        [
+            [1.02, 0.03, 5.0],
+            [-0.02, 0.98, -3.0],
+            [0.00001, -0.00002, 1.0],
+        ]
+    )
+
+
+@pytest.fixture()
+def boxes():
+    """Creates a handful of bounding boxes scattered across a chart sized image."""
+    return [
+        BoundingBox(str(ix), 100 * ix, 50 * ix, 100 * ix + 30, 50 * ix + 20)
+        for ix in range(1, 7)
+    ]
+
+
+class TestTransformBoxes:
+    """Tests the transform_boxes function."""
+
+    def test_matches_transform_box(self, homography_matrix, boxes):
+        """Tests that the batched transform matches transforming each box on its own."""
+        batched = transform_boxes(boxes, homography_matrix)
+        for batched_box, box in zip(batched, boxes):
+            single_box = transform_box(box, homography_matrix)
+            assert batched_box.category == single_box.category
+            assert batched_box.box == pytest.approx(single_box.box)
+
+    def test_empty(self, homography_matrix):
+        """Tests transform_boxes on an empty list."""
+        assert transform_boxes([], homography_matrix) == []
+
+
+class TestTransformKeypoints:
+    """Tests the transform_keypoints function."""
+
+    def test_matches_transform_keypoint(self, homography_matrix, boxes):
+        """Tests that the batched transform matches transforming each keypoint on its own."""
+        keypoints = [Keypoint(Point(box.left + 5, box.top + 5), box) for box in boxes]
+        batched = transform_keypoints(keypoints, homography_matrix)
+        for batched_keypoint, keypoint in zip(batched, keypoints):
+            single_keypoint = transform_keypoint(keypoint, homography_matrix)
+            assert batched_keypoint.keypoint.x == pytest.approx(single_keypoint.keypoint.x)
+            assert batched_keypoint.keypoint.y == pytest.approx(single_keypoint.keypoint.y)
+            assert batched_keypoint.bounding_box.box == pytest.approx(
+                single_keypoint.bounding_box.box
+            )
@@ -4,6 +4,7 @@
 from typing import List
 
 # External Imports
+import numpy as np
 from PIL import Image, ImageChops
 import pytest
 
@@ -73,6 +74,17 @@ def test_tile_image(test_image):
             assert diff.getbbox() is None
 
 
+def test_tile_image_array(test_image):
+    """Function that tests tile_image_array matches tile_image, padding included."""
+    image_array = np.array(test_image)[:, :, None]
+    created_tiles = tiling.tile_image_array(image_array, 2, 2, 0.5, 0.5)
+    true_tiles = tiling.tile_image(test_image, 2, 2, 0.5, 0.5)
+    assert [len(row) for row in created_tiles] == [len(row) for row in true_tiles]
+    for created_row, true_row in zip(created_tiles, true_tiles):
+        for created_tile, true_tile in zip(created_row, true_row):
+            assert np.array_equal(created_tile[:, :, 0], np.array(true_tile))
+
+
 class TestValidateTileParameters:
     """Class that organizes test functions for validate_tile_parameters."""
 
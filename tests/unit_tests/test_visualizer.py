@@ -0,0 +1,52 @@
+"""Tests the chart visualizer script."""
+
+# Built-in Imports
+import importlib
+from pathlib import Path
+from types import ModuleType
+
+# External Imports
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="module")
+def visualizer() -> ModuleType:
+    """Imports the visualizer from its scripts folder, since it opens its assets relative to it."""
+    import ChartExtractor
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(Path(ChartExtractor.__file__).parent / "ChartVisualizer" / "scripts")
+        return importlib.import_module("ChartExtractor.ChartVisualizer.scripts.visualizer")
+
+
+def test_stamp_many(visualizer):
+    """Tests that stamp_many writes the mask at each placement."""
+    canvas = np.full((5, 5), 255, dtype=np.uint8)
+    mask = np.array([[True, False], [True, True]])
+    visualizer.stamp_many(canvas, mask, np.array([0, 3]), np.array([1, 2]))
+    expected = np.full((5, 5), 255, dtype=np.uint8)
+    expected[1:3, 0:2][mask] = 0
+    expected[2:4, 3:5][mask] = 0
+    np.testing.assert_array_equal(canvas, expected)
+
+
+@pytest.mark.parametrize(
+    "xs, ys",
+    [
+        ([-1], [0]),
+        ([0], [-1]),
+        ([-2], [-2]),
+        ([4], [0]),
+        ([0], [4]),
+        ([10], [10]),
+    ],
+)
+def test_stamp_many_clips_off_canvas(visualizer, xs, ys):
+    """Tests that stamp_many only draws the part of a placement that lands on the canvas."""
+    canvas = np.full((5, 5), 255, dtype=np.uint8)
+    mask = np.ones((2, 2), dtype=bool)
+    visualizer.stamp_many(canvas, mask, np.array(xs), np.array(ys))
+    expected = np.full((7 + 10, 7 + 10), 255, dtype=np.uint8)
+    expected[ys[0] + 2 : ys[0] + 4, xs[0] + 2 : xs[0] + 4] = 0
+    np.testing.assert_array_equal(canvas, expected[2:7, 2:7])